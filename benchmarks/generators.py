@@ -0,0 +1,126 @@
+import random
+import string
+
+import pandas as pd
+
+
+def generate_reserved_words(
+    n_words: int, min_size: int = 2, max_size: int = 8, seed: int = 0
+) -> list:
+    """Gera palavras reservadas distintas, em minúsculas, para a gramática sintética.
+
+    Args:
+        n_words (int): Quantidade de palavras reservadas.
+        min_size (int): Tamanho mínimo de cada palavra.
+        max_size (int): Tamanho máximo de cada palavra.
+        seed (int): Semente do gerador aleatório.
+
+    Returns:
+        list: Lista com as palavras reservadas, na ordem em que foram geradas.
+    """
+    rng = random.Random(seed)
+    words = {}
+    while len(words) < n_words:
+        size = rng.randint(min_size, max_size)
+        words.setdefault(
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(size)), None
+        )
+    return list(words)
+
+
+def generate_rules(n_productions: int, nullable: float = 0.3, seed: int = 0) -> list:
+    """Gera regras no formato '<X> ::= a<Y> | b<Z> | ε' com a quantidade de produções pedida.
+
+    Args:
+        n_productions (int): Quantidade total de produções, distribuídas entre as variáveis.
+        nullable (float): Proporção das variáveis que recebem também a alternativa 'ε'.
+        seed (int): Semente do gerador aleatório.
+
+    Returns:
+        list: Lista com uma linha por regra, começando por '<S> ::='.
+
+    Nota:
+    - As variáveis seguem o 'entrada.csv' e têm uma única letra maiúscula (exceto 'Z', reservada para o
+      estado de erro), então há no máximo 25 regras; as produções excedentes são distribuídas entre elas.
+      A 'Grammar' também aceita nomes com várias letras ('<AB>'), mas o gerador não os usa.
+    - A alternativa 'ε' é o que permite terminar uma derivação: sem ela, nenhum estado das regras alcança um
+      estado final e 'remove_dead_states' descarta todos. Por isso a última variável é sempre anulável, e a
+      quantidade de produções chega até a determinização e a minimização.
+    - A alternativa 'ε' não conta em 'n_productions'.
+    """
+    if n_productions <= 0:
+        return []
+
+    rng = random.Random(seed)
+    variables = ["S"] + [
+        letter for letter in string.ascii_uppercase if letter not in ("S", "Z")
+    ]
+    variables = variables[: max(1, min(len(variables), n_productions // 2 or 1))]
+
+    productions = {variable: [] for variable in variables}
+    for i in range(n_productions):
+        productions[variables[i % len(variables)]].append(
+            f"{rng.choice(string.ascii_lowercase)}<{rng.choice(variables)}>"
+        )
+
+    for variable in variables:
+        if variable == variables[-1] or rng.random() < nullable:
+            productions[variable].append("ε")
+
+    return [
+        f"<{variable}> ::= {' | '.join(body)}" for variable, body in productions.items()
+    ]
+
+
+def generate_grammar(
+    n_words: int, n_productions: int = 0, nullable: float = 0.3, seed: int = 0
+) -> pd.DataFrame:
+    """Gera uma gramática sintética no formato do 'entrada.csv'.
+
+    Args:
+        n_words (int): Quantidade de palavras reservadas.
+        n_productions (int): Quantidade de produções das regras '<X> ::= a<Y> | ...'.
+        nullable (float): Proporção das variáveis das regras com a alternativa 'ε' (ver 'generate_rules').
+        seed (int): Semente do gerador aleatório.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha por palavra reservada ou regra, como o 'pd.read_csv'
+            do 'entrada.csv' com 'header=None'.
+    """
+    lines = generate_reserved_words(n_words, seed=seed) + generate_rules(
+        n_productions, nullable=nullable, seed=seed
+    )
+    return pd.DataFrame(lines)
+
+
+def generate_input(
+    reserved_words: list,
+    n_lines: int,
+    words_per_line: int = 10,
+    noise: float = 0.1,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Gera um arquivo de entrada sintético no formato do 'entrada_2.csv'.
+
+    Args:
+        reserved_words (list): Palavras reservadas da gramática.
+        n_lines (int): Quantidade de linhas.
+        words_per_line (int): Quantidade de palavras por linha.
+        noise (float): Proporção de palavras aleatórias, que não são palavras reservadas.
+        seed (int): Semente do gerador aleatório.
+
+    Returns:
+        pd.DataFrame: DataFrame com uma linha de texto por linha de entrada.
+    """
+    rng = random.Random(seed)
+
+    def word():
+        if not reserved_words or rng.random() < noise:
+            return "".join(
+                rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 8))
+            )
+        return rng.choice(reserved_words)
+
+    return pd.DataFrame(
+        [" ".join(word() for _ in range(words_per_line)) for _ in range(n_lines)]
+    )
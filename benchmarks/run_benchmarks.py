@@ -0,0 +1,204 @@
+"""Mede o tempo de cada etapa da construção e do reconhecimento do AFD em gramáticas sintéticas.
+
+Uso (a partir da raiz do projeto):
+
+    python -m benchmarks.run_benchmarks --words 10 100 1000 --output resultados.json
+    python -m benchmarks.run_benchmarks --compare antes.json depois.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from benchmarks.generators import generate_grammar, generate_input
+from utils.all_functions import (
+    af_mapping,
+    compile_afd,
+    create_afnd,
+    determinize_afnd,
+    error_states,
+    minimize_afd,
+    remove_dead_states,
+    remove_unreachable_states,
+    reserved_words_and_counts,
+    scan_lines,
+    tokenize,
+)
+
+
+def run_pipeline(csv_df, input_df) -> list:
+    """Executa todas as etapas uma vez, retornando o tempo e o número de estados de cada uma.
+
+    Args:
+        csv_df (pd.DataFrame): Gramática.
+        input_df (pd.DataFrame): Entrada a ser reconhecida.
+
+    Returns:
+        list: Lista de dicionários {"stage": str, "seconds": float, "states": int}.
+    """
+    results = []
+
+    def measure(stage, function, *args):
+        start = time.perf_counter()
+        output = function(*args)
+        seconds = time.perf_counter() - start
+        table = output[0] if isinstance(output, tuple) else output
+        states = len(table) if hasattr(table, "__len__") else None
+        results.append({"stage": stage, "seconds": seconds, "states": states})
+        return output
+
+    afnd_df, final_states = measure("create_afnd", create_afnd, csv_df)
+    afnd_df = measure("remove_unreachable_states", remove_unreachable_states, afnd_df)
+    afnd_df = measure("remove_dead_states", remove_dead_states, afnd_df, final_states)
+    afd_df, final_states = measure(
+        "determinize_afnd", determinize_afnd, csv_df, afnd_df, final_states
+    )
+    afd_df, final_states = measure("error_states", error_states, afd_df, final_states)
+    afd_df, final_states, _ = measure(
+        "minimize_afd", minimize_afd, afd_df, final_states
+    )
+    automaton = measure("compile_afd", compile_afd, afd_df, final_states)
+    results[-1]["states"] = len(automaton.states)
+
+    lines = input_df[0].tolist()
+    measure("af_mapping", af_mapping, input_df.copy(), automaton)
+    measure("tokenize", lambda: sum(1 for _ in tokenize(lines, automaton)))
+    measure("scan_lines", lambda: sum(1 for _ in scan_lines(lines, automaton)))
+    for result in results[-3:]:
+        result["states"] = None
+
+    return results
+
+
+def run_sweep(
+    word_counts: list,
+    n_productions: int,
+    n_lines: int,
+    words_per_line: int,
+    repeat: int,
+    seed: int = 0,
+) -> list:
+    """Executa o pipeline para cada tamanho de gramática, guardando o menor tempo de cada etapa.
+
+    Args:
+        word_counts (list): Quantidades de palavras reservadas a serem medidas.
+        n_productions (int): Quantidade de produções das regras da gramática.
+        n_lines (int): Quantidade de linhas da entrada.
+        words_per_line (int): Quantidade de palavras por linha da entrada.
+        repeat (int): Quantidade de repetições de cada medição.
+        seed (int): Semente dos geradores.
+
+    Returns:
+        list: Lista de dicionários com os parâmetros, a etapa, o tempo e o número de estados.
+    """
+    results = []
+    for n_words in word_counts:
+        csv_df = generate_grammar(n_words, n_productions, seed=seed)
+        reserved_words = [row["word"] for row in reserved_words_and_counts(csv_df)]
+        input_df = generate_input(reserved_words, n_lines, words_per_line, seed=seed)
+
+        best = {}
+        for _ in range(repeat):
+            for result in run_pipeline(csv_df, input_df):
+                stage = result["stage"]
+                if stage not in best or result["seconds"] < best[stage]["seconds"]:
+                    best[stage] = result
+
+        for result in best.values():
+            results.append(
+                {
+                    "words": n_words,
+                    "productions": n_productions,
+                    "input_lines": n_lines,
+                    "words_per_line": words_per_line,
+                    **result,
+                }
+            )
+            print(
+                f"{n_words:>7} palavras  {result['stage']:<26}"
+                f"{result['seconds'] * 1000:>12.2f} ms"
+                + (f"  {result['states']} estados" if result["states"] else "")
+            )
+    return results
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Imprime a razão entre os tempos de dois arquivos de resultados (antes / depois)."""
+    with open(before_path, encoding="utf-8") as file:
+        before = json.load(file)
+    with open(after_path, encoding="utf-8") as file:
+        after = json.load(file)
+
+    def key(result):
+        return (result["words"], result["productions"], result["stage"])
+
+    before_times = {key(result): result["seconds"] for result in before["results"]}
+    print(f"{before['commit'] or before_path} -> {after['commit'] or after_path}")
+    for result in after["results"]:
+        if key(result) not in before_times:
+            continue
+        ratio = before_times[key(result)] / max(result["seconds"], 1e-9)
+        print(
+            f"{result['words']:>7} palavras  {result['stage']:<26}"
+            f"{before_times[key(result)] * 1000:>12.2f} ms"
+            f"{result['seconds'] * 1000:>12.2f} ms  {ratio:>7.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--productions", type=int, default=0)
+    parser.add_argument("--lines", type=int, default=1000)
+    parser.add_argument("--words-per-line", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Arquivo JSON onde os resultados são salvos")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("ANTES", "DEPOIS"),
+        help="Compara dois arquivos de resultados em vez de medir",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = run_sweep(
+        args.words,
+        args.productions,
+        args.lines,
+        args.words_per_line,
+        args.repeat,
+        args.seed,
+    )
+    if args.output:
+        report = {
+            "commit": current_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
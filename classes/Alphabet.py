@@ -2,19 +2,72 @@ import string
 
 
 class Alphabet:
-    alphabet = list(string.ascii_uppercase)
+    """Gera os nomes dos estados a partir de ids inteiros: A, B, ..., Y, AA, AB, ...
+
+    Os nomes são gerados sob demanda e guardados em cache, então não há limite de estados
+    e as conversões id <-> nome são O(1). Os nomes reservados ("S" para o estado inicial e
+    "Z" para o estado de erro) nunca são gerados.
+    """
+
+    letters = string.ascii_uppercase
+    reserved = frozenset(("S", "Z"))
+    alphabet = []  # Cache dos nomes já gerados, na ordem dos ids
+    ids = {}  # Nome -> id
+    _next_number = 0  # Próximo número a ser convertido para nome
+    separator = "."  # Separa os nomes nos conjuntos com algum estado de várias letras
 
     def __init__(self) -> None:
         pass
 
     @classmethod
-    def get_next_letter(cls, last_state: str) -> str:  # Added self parameter
-        # Corrected reference to class variable
-        return cls.alphabet[cls.alphabet.index(last_state) + 1]
+    def _number_to_name(cls, number: int) -> str:
+        # Numeração bijetiva na base 26: 0 -> A, 25 -> Z, 26 -> AA, ...
+        name = ""
+        number += 1
+        while number:
+            number, remainder = divmod(number - 1, len(cls.letters))
+            name = cls.letters[remainder] + name
+        return name
+
+    @classmethod
+    def _extend(cls, index: int) -> None:
+        while len(cls.alphabet) <= index:
+            name = cls._number_to_name(cls._next_number)
+            cls._next_number += 1
+            if name in cls.reserved:
+                continue
+            cls.ids[name] = len(cls.alphabet)
+            cls.alphabet.append(name)
+
+    @classmethod
+    def get_next_letter(cls, last_state: str) -> str:
+        return cls.index_to_letter(cls.letter_to_index(last_state) + 1)
 
     @classmethod
-    def index_to_letter(cls, index: int) -> str:  # Added self parameter
-        return cls.alphabet[index]  # Corrected reference to class variable
+    def index_to_letter(cls, index: int) -> str:
+        if index < 0:
+            raise IndexError(f"Índice de estado inválido: {index}")
+        cls._extend(index)
+        return cls.alphabet[index]
+
+    @classmethod
+    def letter_to_index(cls, letter: str) -> int:
+        if letter not in cls.ids:
+            raise ValueError(f"Estado {letter!r} não foi gerado pelo alfabeto")
+        return cls.ids[letter]
+
+    @classmethod
+    def subset_name(cls, names: list) -> str:
+        """Nome do estado do AFD formado pelos estados do AFND: "A", "[AH]" ou "[A.BC]".
+
+        Com nomes de uma letra, a concatenação já identifica o conjunto. Se algum nome tiver várias
+        letras, os nomes são separados por ``separator``, senão {A, BC} e {AB, C} teriam o mesmo nome.
+        """
+        if len(names) == 1:
+            return names[0]
+        if all(len(name) == 1 for name in names):
+            return f"[{''.join(names)}]"
+        return f"[{cls.separator.join(names)}]"
 
 
 alphabet = Alphabet()
@@ -0,0 +1,97 @@
+import pandas as pd
+
+
+class AutomatonBuilder:
+    """Acumula as transições de um autômato antes de montar o DataFrame.
+
+    As transições ficam em um dicionário ``{estado: {símbolo: {destino: None}}}`` (dicionários
+    usados como conjuntos que preservam a ordem de inserção), então adicionar uma transição é
+    O(1) e o DataFrame é montado uma única vez, em ``to_dataframe``.
+    """
+
+    def __init__(self, symbols: list = ()) -> None:
+        """Construtor da classe AutomatonBuilder
+
+        Parameters
+        ----------
+        symbols : list
+            Símbolos (colunas) do autômato, na ordem em que devem aparecer.
+        """
+        self.symbols = list(dict.fromkeys(str(symbol) for symbol in symbols))
+        self.transitions = {}
+
+    @classmethod
+    def from_dataframe(cls, afnd_df: pd.DataFrame) -> "AutomatonBuilder":
+        """Lê um autômato representado como DataFrame, com células do tipo "A" ou "A,B".
+
+        Parameters
+        ----------
+        afnd_df : pd.DataFrame
+            DataFrame com a coluna ``sigma`` e uma coluna por símbolo.
+
+        Returns
+        -------
+        AutomatonBuilder
+            Construtor com os mesmos estados, símbolos e transições.
+        """
+        builder = cls(afnd_df.columns[1:])
+        cells = afnd_df[afnd_df.columns[1:]].to_numpy(dtype=object)
+        for state, row in zip(afnd_df["sigma"], cells):
+            builder.add_state(str(state))
+            for symbol, cell in zip(builder.symbols, row):
+                if isinstance(cell, str) and cell != "":
+                    for target in cell.split(","):
+                        if target:
+                            builder.add_edge(str(state), symbol, target)
+        return builder
+
+    def add_state(self, state: str) -> None:
+        """Adiciona um estado sem transições, se ele ainda não existir."""
+        if state not in self.transitions:
+            self.transitions[state] = {}
+
+    def add_edge(self, state: str, symbol: str, target: str) -> None:
+        """Adiciona a transição ``state --symbol--> target``, criando o estado e o símbolo se necessário."""
+        if target == "" or target is None:
+            return
+        edges = self.transitions.setdefault(state, {})
+        if symbol not in edges:
+            if symbol not in self.symbols:
+                self.symbols.append(symbol)
+            edges[symbol] = {}
+        edges[symbol][target] = None
+
+    def targets(self, state: str, symbol: str) -> list:
+        """Retorna os estados destino de uma transição, na ordem em que foram adicionados."""
+        return list(self.transitions.get(state, {}).get(symbol, ()))
+
+    @property
+    def states(self) -> list:
+        """Estados, na ordem em que foram adicionados."""
+        return list(self.transitions)
+
+    def transition_count(self) -> int:
+        """Quantidade de transições (pares estado/símbolo/destino)."""
+        return sum(
+            len(targets)
+            for edges in self.transitions.values()
+            for targets in edges.values()
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Monta o DataFrame do autômato, com os destinos de cada célula separados por vírgula.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame com a coluna ``sigma`` e uma coluna por símbolo.
+        """
+        rows = [
+            [state]
+            + [
+                ",".join(edges[symbol]) if symbol in edges else ""
+                for symbol in self.symbols
+            ]
+            for state, edges in self.transitions.items()
+        ]
+        return pd.DataFrame(rows, columns=["sigma"] + self.symbols)
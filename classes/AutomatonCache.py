@@ -0,0 +1,174 @@
+import os
+import time
+from collections import OrderedDict as od
+
+from classes.CompiledAutomaton import CompiledAutomaton
+
+
+class AutomatonCache:
+    """Cache de autômatos compilados, indexado pela chave da gramática ('automaton_key'), que também
+    inclui a versão da construção do AFD.
+
+    Mantém um LRU em memória e, opcionalmente, um diretório com os arquivos binários
+    gerados por ``CompiledAutomaton.save`` (um arquivo ``<chave>.afd`` por gramática).
+    """
+
+    extension = ".afd"
+
+    def __init__(
+        self,
+        directory=None,
+        max_entries: int = 32,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        max_age: float = None,
+    ) -> None:
+        """Construtor da classe AutomatonCache
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            Diretório do cache em disco. Se None, o cache fica apenas em memória.
+        max_entries : int
+            Quantidade máxima de autômatos mantidos em memória.
+        max_disk_bytes : int
+            Tamanho máximo, em bytes, dos arquivos do cache em disco.
+        max_age : float
+            Idade máxima, em segundos, de um arquivo do cache em disco desde o último uso.
+            Se None, os arquivos não expiram.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self.memory = od()
+        self.hits = 0
+        self.misses = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.extension}")
+
+    def get(self, key: str) -> CompiledAutomaton:
+        """Retorna o autômato da chave, ou None se ele não estiver no cache.
+
+        Parameters
+        ----------
+        key : str
+            Chave do autômato ('automaton_key').
+
+        Returns
+        -------
+        CompiledAutomaton
+            Autômato em cache, ou None.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+
+        if self.directory is not None:
+            path = self._path(key)
+            if os.path.exists(path) and not self._expired(path):
+                try:
+                    automaton = CompiledAutomaton.load(path)
+                except FileNotFoundError:
+                    pass  # Removido por outro processo
+                except ValueError:
+                    os.remove(path)  # Arquivo corrompido ou de outra versão
+                else:
+                    os.utime(path)  # Marca o uso para a expiração por idade
+                    self._remember(key, automaton)
+                    self.hits += 1
+                    return automaton
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, automaton: CompiledAutomaton) -> None:
+        """Guarda o autômato no cache em memória e, se configurado, em disco.
+
+        Parameters
+        ----------
+        key : str
+            Chave do autômato ('automaton_key').
+        automaton : CompiledAutomaton
+            Autômato compilado.
+        """
+        self._remember(key, automaton)
+
+        if self.directory is not None:
+            path = self._path(key)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            automaton.save(temporary_path)
+            # Outros processos nunca veem o arquivo pela metade
+            os.replace(temporary_path, path)
+            self.evict()
+
+    def get_or_build(self, key: str, build) -> CompiledAutomaton:
+        """Retorna o autômato da chave, construindo e guardando-o se necessário.
+
+        Parameters
+        ----------
+        key : str
+            Chave do autômato ('automaton_key').
+        build : callable
+            Função sem argumentos que constrói o autômato.
+
+        Returns
+        -------
+        CompiledAutomaton
+            Autômato em cache ou recém-construído.
+        """
+        automaton = self.get(key)
+        if automaton is None:
+            automaton = build()
+            self.put(key, automaton)
+        return automaton
+
+    def evict(self) -> None:
+        """Remove do disco os arquivos expirados e os menos usados até respeitar 'max_disk_bytes'."""
+        if self.directory is None:
+            return
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.extension):
+                continue
+            path = os.path.join(self.directory, name)
+            if self._expired(path):
+                os.remove(path)
+                continue
+            status = os.stat(path)
+            entries.append((status.st_mtime, status.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):  # Os mais antigos primeiro
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Esvazia o cache em memória e em disco."""
+        self.memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(self.extension):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _remember(self, key: str, automaton: CompiledAutomaton) -> None:
+        self.memory[key] = automaton
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _expired(self, path: str) -> bool:
+        return (
+            self.max_age is not None
+            and time.time() - os.path.getmtime(path) > self.max_age
+        )
+
+
+automaton_cache = AutomatonCache()
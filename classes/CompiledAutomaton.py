@@ -0,0 +1,618 @@
+import json
+import struct
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # O Numba é opcional: sem ele, 'run_batch' usa o laço em Python
+    njit = None
+
+
+class CompiledAutomaton:
+    """Tabela de transição do AFD compilada para inteiros.
+
+    Cada estado vira uma linha e os símbolos (colunas do DataFrame) com colunas
+    idênticas são agrupados em uma mesma classe de símbolo, de modo que a tabela
+    tem uma coluna por classe e um passo do reconhecimento é apenas o mapa
+    caractere -> classe seguido da indexação em ``table[estado, classe]``.
+    Caracteres que não aparecem nas colunas caem na classe da coluna ``etc.``.
+    """
+
+    other_column = "etc."
+    error_states = ("&", "Z")  # Estados criados por 'error_states'
+    whitespace = " \t\r\n\f\v"
+
+    _magic = b"AFDC"
+    _version = 2
+    _header = struct.Struct("<4sIIIi32sIQQ")
+
+    def __init__(
+        self,
+        states: list,
+        symbols: list,
+        table: np.ndarray,
+        final: np.ndarray,
+        initial: int = 0,
+        source_hash: str = "",
+        classes: list = None,
+    ) -> None:
+        """Construtor da classe CompiledAutomaton
+
+        Parameters
+        ----------
+        states : list
+            Nomes dos estados, na ordem das linhas de ``table``.
+        symbols : list
+            Símbolos do alfabeto (colunas do DataFrame), incluindo ``etc.``.
+        table : np.ndarray
+            Matriz ``int32`` (estados x classes) com o id do estado destino, ou -1
+            quando não há transição.
+        final : np.ndarray
+            Vetor booleano indicando os estados finais.
+        initial : int
+            Id do estado inicial.
+        source_hash : str
+            Hash (sha256 em hexadecimal) da gramática que gerou o autômato, ou vazio.
+        classes : list
+            Classe (coluna de ``table``) de cada símbolo, na ordem de ``symbols``. Por padrão,
+            cada símbolo é uma classe e ``table`` tem uma coluna por símbolo.
+        """
+        self.states = list(states)
+        self.symbols = list(symbols)
+        self.table = (
+            table
+            if isinstance(table, np.memmap)
+            else np.ascontiguousarray(table, dtype=np.int32)
+        )
+        self.final = np.asarray(final, dtype=bool)
+        self.initial = initial
+        self.source_hash = source_hash
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.classes = (
+            list(range(len(self.symbols))) if classes is None else list(classes)
+        )
+
+        self.other_class = (
+            self.classes[self.symbols.index(self.other_column)]
+            if self.other_column in self.symbols
+            else -1
+        )
+        self.char_classes = {
+            symbol: symbol_class
+            for symbol, symbol_class in zip(self.symbols, self.classes)
+            if symbol != self.other_column
+        }
+        # Mapa byte -> classe, usado quando a entrada já está em bytes (UTF-8). Só os símbolos ASCII
+        # ocupam um byte; os demais bytes caem na coluna 'etc.', e com algum símbolo fora do ASCII
+        # ('ascii' False) a leitura em bytes não equivale à leitura do texto.
+        self.ascii = all(symbol.isascii() for symbol in self.char_classes)
+        self.byte_classes = np.full(256, self.other_class, dtype=np.int32)
+        for symbol, i in self.char_classes.items():
+            if len(symbol) == 1 and symbol.isascii():
+                self.byte_classes[ord(symbol)] = i
+        self._byte_class_dict = dict(enumerate(self.byte_classes.tolist()))
+        self._byte_whitespace = frozenset(self.whitespace.encode("ascii"))
+
+        self._width = self.table.shape[1]
+        self._delta_list = None
+        self._live_list = None
+        self._accepting_list = None
+
+    @property
+    def _delta(self):
+        # Versão em lista do Python, criada no primeiro uso: indexar listas é mais rápido
+        # que indexar arrays do NumPy elemento a elemento dentro de um laço do Python.
+        # Uma tabela mapeada em memória é lida por um 'memoryview', tão rápido quanto a lista e
+        # sem copiar a tabela: os processos que mapeiam o mesmo arquivo dividem as mesmas páginas.
+        if self._delta_list is None:
+            if isinstance(self.table, np.memmap) and self.table.dtype.isnative:
+                self._delta_list = memoryview(self.table.reshape(-1))
+            else:
+                self._delta_list = self.table.ravel().tolist()
+        return self._delta_list
+
+    @property
+    def accepting(self) -> np.ndarray:
+        """Estados que encerram um token: os finais, exceto os estados de erro."""
+        accepting = self.final.copy()
+        for state in self.error_states:
+            if state in self.state_index:
+                accepting[self.state_index[state]] = False
+        return accepting
+
+    @property
+    def _live(self) -> list:
+        # Estados que ainda alcançam um estado de aceitação (busca reversa na tabela)
+        if self._live_list is None:
+            live = self.accepting
+            predecessors = [[] for _ in self.states]
+            for source, target in zip(*np.nonzero(self.table >= 0)):
+                predecessors[self.table[source, target]].append(source)
+            stack = list(np.flatnonzero(live))
+            while stack:
+                for source in predecessors[stack.pop()]:
+                    if not live[source]:
+                        live[source] = True
+                        stack.append(source)
+            self._live_list = live.tolist()
+        return self._live_list
+
+    @classmethod
+    def symbol_classes(cls, table: np.ndarray, symbols: list) -> tuple:
+        """Agrupa os símbolos cujas colunas da tabela são idênticas em classes de símbolo.
+
+        Parameters
+        ----------
+        table : np.ndarray
+            Matriz (estados x símbolos) com o id do estado destino.
+        symbols : list
+            Símbolos, na ordem das colunas de ``table``.
+
+        Returns
+        -------
+        tuple
+            Tupla com a matriz (estados x classes), com uma coluna por classe na ordem em que
+            as classes aparecem, e a lista com a classe de cada símbolo.
+
+        Notes
+        -----
+        A coluna ``etc.`` é sempre uma classe própria, para que 'trace' continue parando nela.
+        """
+        columns = {}
+        classes = []
+        representatives = []
+        for j, symbol in enumerate(symbols):
+            key = (
+                (symbol,)
+                if symbol == cls.other_column
+                else np.ascontiguousarray(table[:, j]).tobytes()
+            )
+            if key not in columns:
+                columns[key] = len(representatives)
+                representatives.append(j)
+            classes.append(columns[key])
+        return table[:, representatives], classes
+
+    @classmethod
+    def from_dataframe(
+        cls, afd_df: pd.DataFrame, final_states: list = (), compress: bool = True
+    ) -> "CompiledAutomaton":
+        """Compila um AFD representado como DataFrame.
+
+        Parameters
+        ----------
+        afd_df : pd.DataFrame
+            DataFrame com o AFD, com a coluna ``sigma`` e uma coluna por símbolo.
+        final_states : list
+            Lista de estados finais.
+        compress : bool
+            Se True, os símbolos com colunas idênticas são agrupados em classes ('symbol_classes').
+
+        Returns
+        -------
+        CompiledAutomaton
+            Autômato compilado.
+        """
+        states = [str(state) for state in afd_df["sigma"]]
+        state_index = {state: i for i, state in enumerate(states)}
+        symbols = [str(column) for column in afd_df.columns[1:]]
+
+        cells = afd_df[afd_df.columns[1:]].fillna("").to_numpy(dtype=object)
+        table = np.full(cells.shape, -1, dtype=np.int32)
+        for (i, j), value in np.ndenumerate(cells):
+            if value != "":
+                table[i, j] = state_index[value]
+
+        final = np.zeros(len(states), dtype=bool)
+        for state in final_states:
+            if state in state_index:
+                final[state_index[state]] = True
+
+        classes = None
+        if compress:
+            table, classes = cls.symbol_classes(table, symbols)
+
+        return cls(
+            states, symbols, table, final, state_index.get("S", 0), classes=classes
+        )
+
+    def save(self, path) -> None:
+        """Salva o autômato em um arquivo binário que pode ser mapeado em memória.
+
+        Formato (little-endian)::
+
+            cabeçalho   magic, versão, nº de estados, nº de classes, estado inicial,
+                        sha256 da gramática, tamanho dos metadados, offsets da tabela
+                        e do bitset
+            metadados   JSON em UTF-8 com os nomes dos estados, os símbolos e a classe de cada símbolo
+            tabela      matriz int32 (estados x classes), alinhada em 8 bytes
+            finais      bitset dos estados finais (np.packbits)
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Caminho do arquivo.
+        """
+        metadata = json.dumps(
+            {"states": self.states, "symbols": self.symbols, "classes": self.classes},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        table_offset = _align(self._header.size + len(metadata))
+        final_offset = table_offset + self.table.size * 4
+
+        header = self._header.pack(
+            self._magic,
+            self._version,
+            len(self.states),
+            self._width,
+            self.initial,
+            bytes.fromhex(self.source_hash) if self.source_hash else bytes(32),
+            len(metadata),
+            table_offset,
+            final_offset,
+        )
+        with open(path, "wb") as file:
+            file.write(header)
+            file.write(metadata)
+            file.write(bytes(table_offset - len(header) - len(metadata)))
+            file.write(self.table.astype("<i4", copy=False).tobytes())
+            file.write(np.packbits(self.final).tobytes())
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "CompiledAutomaton":
+        """Carrega um autômato salvo com 'save'.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Caminho do arquivo.
+        mmap : bool
+            Se True, a tabela é mapeada em memória com ``numpy.memmap`` (somente leitura), de modo
+            que vários processos compartilham a mesma cópia; 'run', 'trace' e 'scan' leem as páginas
+            mapeadas sem copiar a tabela. Se False, a tabela é lida para a memória do processo.
+
+        Returns
+        -------
+        CompiledAutomaton
+            Autômato carregado.
+
+        Raises
+        ------
+        ValueError
+            Se o arquivo não estiver no formato esperado.
+        """
+        with open(path, "rb") as file:
+            header = file.read(cls._header.size)
+            if len(header) != cls._header.size:
+                raise ValueError(f"Arquivo de autômato inválido: {path}")
+            (
+                magic,
+                version,
+                n_states,
+                n_classes,
+                initial,
+                digest,
+                metadata_size,
+                table_offset,
+                final_offset,
+            ) = cls._header.unpack(header)
+            if magic != cls._magic or version != cls._version:
+                raise ValueError(f"Arquivo de autômato inválido: {path}")
+            metadata = json.loads(file.read(metadata_size).decode("utf-8"))
+
+            if mmap:
+                table = np.memmap(
+                    path,
+                    dtype="<i4",
+                    mode="r",
+                    offset=table_offset,
+                    shape=(n_states, n_classes),
+                )
+            else:
+                file.seek(table_offset)
+                table = np.frombuffer(
+                    file.read(n_states * n_classes * 4), dtype="<i4"
+                ).reshape(n_states, n_classes)
+
+            file.seek(final_offset)
+            final = np.unpackbits(
+                np.frombuffer(file.read((n_states + 7) // 8), dtype=np.uint8),
+                count=n_states,
+            ).astype(bool)
+
+        source_hash = digest.hex() if any(digest) else ""
+        return cls(
+            metadata["states"],
+            metadata["symbols"],
+            table,
+            final,
+            initial,
+            source_hash,
+            metadata["classes"],
+        )
+
+    def to_source(self) -> str:
+        """Gera o código de um módulo Python independente que reconhece palavras neste autômato.
+
+        O módulo não importa nada (nem pandas, nem NumPy): cada estado vira um dicionário
+        caractere -> estado destino, o destino dos caracteres fora do alfabeto vira uma constante
+        quando é o mesmo em todos os estados, e a verificação de transição faltando só é gerada
+        se a tabela tiver células vazias. O módulo expõe ``STATES``, ``SOURCE_HASH``, ``run``,
+        ``recognize`` e ``accepts``, com a mesma semântica dos métodos desta classe para ``str``.
+
+        Returns
+        -------
+        str
+            Código-fonte do módulo.
+        """
+        table = np.asarray(self.table).tolist()
+        accepting = np.flatnonzero(self.accepting).tolist()
+
+        if self.other_class >= 0:
+            others = [row[self.other_class] for row in table]
+        else:
+            others = [-1] * len(table)
+        constant_other = len(set(others)) <= 1
+        missing = (
+            any(target < 0 for row in table for target in row)
+            or min(others, default=0) < 0
+        )
+
+        rows = []
+        for state, row in zip(self.states, table):
+            delta = {
+                char: row[symbol_class]
+                for char, symbol_class in self.char_classes.items()
+            }
+            rows.append(f"    {delta!r},  # {state}")
+
+        lookup = "OTHER" if constant_other else "_OTHERS[state]"
+        check = "\n        if state < 0:\n            return -1" if missing else ""
+        lines = [
+            f"# Gerado por CompiledAutomaton.to_source (formato {self._version}). Não edite.",
+            '"""Reconhecedor do AFD gerado a partir da gramática."""',
+            "",
+            f"SOURCE_HASH = {self.source_hash!r}",
+            f"STATES = {tuple(self.states)!r}",
+            f"INITIAL = {self.initial!r}",
+            f"ACCEPTING = frozenset({accepting!r})",
+            f"OTHER = {others[0] if constant_other and others else -1!r}",
+        ]
+        if not constant_other:
+            lines.append(f"_OTHERS = {tuple(others)!r}")
+        lines += [
+            "_DELTA = (",
+            *rows,
+            ")",
+            "",
+            "",
+            "def run(word):",
+            '    """Retorna o id do estado em que a palavra termina, ou -1 se faltar transição."""',
+            "    delta = _DELTA",
+            "    state = INITIAL",
+            "    for char in word:",
+            f"        state = delta[state].get(char, {lookup}){check}",
+            "    return state",
+            "",
+            "",
+            "def recognize(word):",
+            '    """Retorna o nome do estado em que a palavra termina, ou None se faltar transição."""',
+            "    state = run(word)",
+            "    return STATES[state] if state >= 0 else None",
+            "",
+            "",
+            "def accepts(word):",
+            '    """Indica se a palavra termina em um estado de aceitação (finais, exceto os de erro)."""',
+            "    return run(word) in ACCEPTING",
+            "",
+        ]
+        return "\n".join(lines)
+
+    def _lookups(self, text) -> tuple:
+        # Em bytes (bytes, memoryview, mmap), cada posição é um inteiro de 0 a 255
+        if isinstance(text, str):
+            return self.char_classes, self.whitespace
+        return self._byte_class_dict, self._byte_whitespace
+
+    def run(self, word, state: int = None) -> int:
+        """Percorre a tabela consumindo a palavra a partir de um estado.
+
+        Parameters
+        ----------
+        word : str | bytes | memoryview
+            Palavra a ser reconhecida. Em bytes (UTF-8), cada byte ASCII é um caractere e os demais
+            caem na coluna ``etc.``.
+        state : int
+            Id do estado de partida. Por padrão, o estado inicial.
+
+        Returns
+        -------
+        int
+            Id do estado alcançado, ou -1 se faltou transição no caminho.
+        """
+        delta = self._delta
+        width = self._width
+        classes, _ = self._lookups(word)
+        other = self.other_class
+        state = self.initial if state is None else state
+
+        for char in word:
+            symbol_class = classes.get(char, other)
+            if symbol_class < 0:
+                return -1
+            state = delta[state * width + symbol_class]
+            if state < 0:
+                return -1
+        return state
+
+    def recognize(self, word) -> str:
+        """Retorna o nome do estado em que a palavra termina, ou None se não houver transição."""
+        state = self.run(word)
+        return self.states[state] if state >= 0 else None
+
+    def trace(self, word: str) -> list:
+        """Retorna a lista de estados visitados ao consumir a palavra, um por caractere.
+
+        O percurso para no estado de erro da coluna ``etc.``, assim como a busca original
+        em DataFrame, e também para quando falta transição.
+        """
+        delta = self._delta
+        width = self._width
+        classes = self.char_classes
+        other = self.other_class
+        state = self.initial
+        visited_states = []
+
+        for char in word:
+            symbol_class = classes.get(char, other)
+            if symbol_class < 0:
+                break
+            state = delta[state * width + symbol_class]
+            if state < 0:
+                break
+            visited_states.append(self.states[state])
+            if symbol_class == other:
+                break
+        return visited_states
+
+    def scan(self, text, start: int = 0, end: int = None):
+        """Reconhece os tokens do texto pelo casamento mais longo (maximal munch), sem dividir o texto.
+
+        A partir de 'S', o texto é percorrido enquanto ainda é possível chegar a um estado de
+        aceitação, guardando a última posição aceita. O token vai até essa posição e o
+        reconhecimento recomeça de 'S' logo depois dele. Espaços em branco entre tokens são
+        ignorados.
+
+        Parameters
+        ----------
+        text : str | bytes | memoryview | mmap.mmap
+            Texto (linha ou buffer) a ser reconhecido. Em bytes, nada é copiado e cada byte é um
+            caractere, como em 'run'.
+        start : int
+            Posição inicial no texto.
+        end : int
+            Posição final no texto (exclusiva). Por padrão, o fim do texto.
+
+        Yields
+        ------
+        tuple
+            Tupla (início, fim, id do estado) de cada token. Quando nenhum prefixo é aceito, é
+            emitido um token de erro com um único caractere e o estado em que o percurso parou
+            (normalmente '&' ou 'Z'), ou -1 se faltou transição.
+        """
+        delta = self._delta
+        live = self._live
+        if self._accepting_list is None:
+            self._accepting_list = self.accepting.tolist()
+        accepting = self._accepting_list
+        width = self._width
+        classes, whitespace = self._lookups(text)
+        other = self.other_class
+        initial = self.initial
+        end = len(text) if end is None else end
+        position = start
+
+        while position < end:
+            if text[position] in whitespace:
+                position += 1
+                continue
+
+            state = initial
+            last_end = -1
+            last_state = -1
+            i = position
+            while i < end:
+                symbol_class = classes.get(text[i], other)
+                if symbol_class < 0:
+                    state = -1
+                    break
+                state = delta[state * width + symbol_class]
+                if state < 0 or not live[state]:
+                    break
+                i += 1
+                if accepting[state]:
+                    last_end = i
+                    last_state = state
+
+            if last_end < 0:
+                yield position, position + 1, state
+                position += 1
+            else:
+                yield position, last_end, last_state
+                position = last_end
+
+    def run_batch(self, buffer, offsets, jit: bool = None) -> np.ndarray:
+        """Percorre a tabela para um lote de palavras em bytes, em uma única chamada.
+
+        Parameters
+        ----------
+        buffer : np.ndarray | bytes
+            Bytes de todas as palavras, concatenados (convertidos para ``uint8`` sem cópia).
+        offsets : np.ndarray
+            Vetor com ``n + 1`` posições: a palavra i é ``buffer[offsets[i]:offsets[i + 1]]``.
+        jit : bool
+            Se True, usa o laço compilado pelo Numba (ImportError se ele não estiver instalado);
+            se False, usa o laço em Python. Por padrão, usa o Numba quando disponível.
+
+        Returns
+        -------
+        np.ndarray
+            Vetor ``int32`` com o id do estado em que cada palavra termina, ou -1 se faltou transição,
+            como em 'run'.
+
+        Raises
+        ------
+        ValueError
+            Se o alfabeto tiver símbolos fora do ASCII, que não cabem em um byte.
+        """
+        if not self.ascii:
+            raise ValueError(
+                "O alfabeto tem símbolos fora do ASCII; use 'run' sobre o texto"
+            )
+        buffer = np.frombuffer(buffer, dtype=np.uint8)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        states = np.empty(max(len(offsets) - 1, 0), dtype=np.int32)
+
+        if jit is None:
+            jit = _run_batch_jit is not None
+        if jit:
+            if _run_batch_jit is None:
+                raise ImportError("O Numba não está instalado")
+            return _run_batch_jit(
+                self.table, self.byte_classes, self.initial, buffer, offsets, states
+            )
+
+        data = memoryview(buffer)
+        bounds = offsets.tolist()
+        for i in range(len(states)):
+            states[i] = self.run(data[bounds[i] : bounds[i + 1]])
+        return states
+
+    def is_final(self, state: int) -> bool:
+        """Indica se o id de estado é final."""
+        return state >= 0 and bool(self.final[state])
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _run_batch(table, byte_classes, initial, buffer, offsets, states):
+    # Mesmo laço de 'run', sobre arrays do NumPy, para ser compilado pelo Numba
+    for token in range(len(offsets) - 1):
+        state = initial
+        for position in range(offsets[token], offsets[token + 1]):
+            symbol_class = byte_classes[buffer[position]]
+            if symbol_class < 0:
+                state = -1
+                break
+            state = table[state, symbol_class]
+            if state < 0:
+                break
+        states[token] = state
+    return states
+
+
+_run_batch_jit = njit(cache=True, nogil=True)(_run_batch) if njit else None
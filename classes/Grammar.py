@@ -0,0 +1,156 @@
+import re
+
+import pandas as pd
+
+
+class Grammar:
+    """Gramática lida do formato do 'entrada.csv', em uma única passada.
+
+    Cada linha é uma palavra reservada (ex.: ``se``) ou uma regra (ex.: ``<S> ::= a<A> | ε``).
+    As regras ficam como dicionários no formato::
+
+        {
+            "symbol": "S",                              # variável do lado esquerdo
+            "productions": ["a<A>", "<B>", "ε"],        # alternativas, na ordem da linha
+            "transitions": [[("a", "A")], [("ε", "B")], []],  # pares (terminal, variável) de cada alternativa
+            "nullable": True,                           # se alguma alternativa é 'ε'
+        }
+
+    Uma alternativa formada só por uma variável (``<B>``) é uma transição ε para ela.
+
+    A gramática é lida uma vez e reaproveitada por todas as etapas da construção do AFND.
+    """
+
+    # As variáveis do arquivo são letras únicas, mas depois de 'rename' viram nomes de estados
+    # (ex.: "AB"), então os padrões aceitam várias letras maiúsculas.
+    rule_header = re.compile(r"<([A-Z]+)> ::=")
+    transition = re.compile(r"([a-z])<([A-Z]+)>")
+    variable = re.compile(r"<([A-Z]+)>")
+    epsilon = "ε"
+
+    def __init__(self) -> None:
+        """Construtor da classe Grammar"""
+        self.reserved_words = []
+        self.rules = []
+        self.terminals = []  # Letras minúsculas das palavras e das regras, sem repetição
+        self.variables = []  # Variáveis do lado direito das regras, sem repetição
+
+    @classmethod
+    def from_lines(cls, lines) -> "Grammar":
+        """Lê a gramática a partir das linhas de texto.
+
+        Parameters
+        ----------
+        lines : iterable
+            Linhas da gramática, uma palavra reservada ou regra por linha.
+
+        Returns
+        -------
+        Grammar
+            Gramática lida.
+        """
+        grammar = cls()
+        terminals = {}
+        variables = {}
+
+        for line in lines:
+            line = str(line)
+            terminals.update(
+                (char, None) for char in line if char.islower() and char != cls.epsilon
+            )
+
+            header = cls.rule_header.search(line)
+            if header is None:
+                grammar.reserved_words.append(line)
+                continue
+
+            productions = [
+                production.strip()
+                for production in line[header.end() :].split("|")
+                if production.strip()
+            ]
+            transitions = [
+                [(cls.epsilon, unit[1])]
+                if (unit := cls.variable.fullmatch(production))
+                else cls.transition.findall(production)
+                for production in productions
+            ]
+            variables.update(
+                (variable, None) for pairs in transitions for _, variable in pairs
+            )
+            grammar.rules.append({
+                "symbol": header[1],
+                "productions": productions,
+                "transitions": transitions,
+                "nullable": cls.epsilon in productions,
+            })
+
+        grammar.terminals = list(terminals)
+        grammar.variables = list(variables)
+        return grammar
+
+    @classmethod
+    def from_dataframe(cls, csv_df: pd.DataFrame) -> "Grammar":
+        """Lê a gramática de um DataFrame como o 'pd.read_csv' do 'entrada.csv' com 'header=None'.
+
+        Parameters
+        ----------
+        csv_df : pd.DataFrame
+            DataFrame com uma linha da gramática em cada célula.
+
+        Returns
+        -------
+        Grammar
+            Gramática lida.
+        """
+        return cls.from_lines(cell for row in csv_df.values for cell in row)
+
+    def rule_words(self) -> list:
+        """Retorna as regras como listas de palavras, ex.: ['<S>', '::=', 'a<A>', '|', 'e<A>']."""
+        return [
+            [f"<{rule['symbol']}>", "::="] + " | ".join(rule["productions"]).split()
+            for rule in self.rules
+        ]
+
+    def rename(self, mapping: dict) -> "Grammar":
+        """Retorna uma cópia da gramática com as variáveis renomeadas, em uma única passada pelas regras.
+
+        Parameters
+        ----------
+        mapping : dict
+            Mapa variável antiga -> nova. Variáveis fora do mapa são mantidas.
+
+        Returns
+        -------
+        Grammar
+            Gramática com as variáveis renomeadas no lado esquerdo e no lado direito das regras.
+        """
+
+        def replace(match):
+            return f"<{mapping.get(match[1], match[1])}>"
+
+        grammar = Grammar()
+        grammar.reserved_words = list(self.reserved_words)
+        grammar.terminals = list(self.terminals)
+        grammar.variables = [
+            mapping.get(variable, variable) for variable in self.variables
+        ]
+        grammar.rules = [
+            {
+                "symbol": mapping.get(rule["symbol"], rule["symbol"]),
+                "productions": [
+                    self.variable.sub(replace, production)
+                    for production in rule["productions"]
+                ],
+                "transitions": [
+                    [
+                        (terminal, mapping.get(variable, variable))
+                        for terminal, variable in pairs
+                    ]
+                    for pairs in rule["transitions"]
+                ],
+                "nullable": rule["nullable"],
+            }
+            for rule in self.rules
+        ]
+        return grammar
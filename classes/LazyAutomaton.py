@@ -0,0 +1,144 @@
+from collections import OrderedDict as od
+
+from classes.Alphabet import Alphabet
+
+
+class LazyAutomaton:
+    """AFD construído sob demanda a partir do AFND, com um cache limitado de estados.
+
+    Os estados do AFD são bitsets de estados do AFND (o bit i é o estado i), como em
+    'subset_construction', mas só são calculados quando alguma entrada chega neles. Cada estado
+    visitado guarda as transições já calculadas em um LRU com no máximo ``max_states`` estados;
+    quando o cache está cheio, o estado usado há mais tempo é descartado e, se for visitado de
+    novo, as transições voltam a ser calculadas pela simulação do AFND.
+
+    Os nomes e o comportamento de erro são os do AFD de 'determinize_afnd' + 'error_states':
+    faltar transição leva a ``&`` e um caractere fora do alfabeto leva a ``Z``.
+    """
+
+    error_transition = "&"  # Estado de 'error_states' para transições que faltam
+    error_symbol = "Z"  # Estado de 'error_states' para caracteres fora do alfabeto
+
+    def __init__(
+        self,
+        states: list,
+        symbols: list,
+        targets_by_state: list,
+        final: int,
+        initial: int = 0,
+        max_states: int = 4096,
+    ) -> None:
+        """Construtor da classe LazyAutomaton
+
+        Parameters
+        ----------
+        states : list
+            Estados do AFND, na ordem dos bits.
+        symbols : list
+            Símbolos do alfabeto, na ordem das colunas de ``targets_by_state``.
+        targets_by_state : list
+            Para cada estado do AFND, a lista com o bitset dos destinos de cada símbolo.
+        final : int
+            Bitset dos estados finais do AFND.
+        initial : int
+            Id do estado inicial do AFND.
+        max_states : int
+            Quantidade máxima de estados do AFD mantidos no cache. Com 0, toda transição é
+            calculada pela simulação do AFND.
+        """
+        self.states = list(states)
+        self.symbols = list(symbols)
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.targets_by_state = targets_by_state
+        self.final = final
+        self.initial = 1 << initial
+        self.max_states = max_states
+
+        self.cache = od()  # Bitset do estado -> {id do símbolo: bitset do destino}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _step(self, subset: int, symbol: int) -> int:
+        row = self.cache.get(subset)
+        if row is not None:
+            target = row.get(symbol)
+            if target is not None:
+                self.hits += 1
+                self.cache.move_to_end(subset)
+                return target
+
+        # Simulação do AFND: união dos destinos de cada estado do conjunto
+        self.misses += 1
+        targets_by_state = self.targets_by_state
+        target = 0
+        remaining = subset
+        while remaining:
+            lowest = remaining & -remaining
+            target |= targets_by_state[lowest.bit_length() - 1][symbol]
+            remaining ^= lowest
+
+        if self.max_states > 0:
+            if row is None:
+                if len(self.cache) >= self.max_states:
+                    self.cache.popitem(last=False)
+                    self.evictions += 1
+                row = self.cache[subset] = {}
+            else:
+                self.cache.move_to_end(subset)
+            row[symbol] = target
+        return target
+
+    def run(self, word: str):
+        """Percorre o AFD consumindo a palavra.
+
+        Returns
+        -------
+        int | str
+            Bitset do estado alcançado, ou o nome do estado de erro (``&`` ou ``Z``).
+        """
+        symbol_index = self.symbol_index
+        subset = self.initial
+        for char in word:
+            symbol = symbol_index.get(char)
+            if symbol is None:
+                return self.error_symbol
+            if subset:
+                subset = self._step(subset, symbol)
+        # O conjunto vazio é o '&', que só sai para 'Z' com um caractere fora do alfabeto
+        return subset if subset else self.error_transition
+
+    def name(self, subset: int) -> str:
+        """Nome do estado do AFD, como em 'subset_name' (ex.: "A" ou "[AH]")."""
+        names = []
+        while subset:
+            lowest = subset & -subset
+            names.append(self.states[lowest.bit_length() - 1])
+            subset ^= lowest
+        return Alphabet.subset_name(names)
+
+    def recognize(self, word: str) -> str:
+        """Retorna o nome do estado em que a palavra termina."""
+        state = self.run(word)
+        return state if isinstance(state, str) else self.name(state)
+
+    def is_final(self, word: str) -> bool:
+        """Indica se a palavra termina em um estado final do AFND (os estados de erro não contam)."""
+        state = self.run(word)
+        return not isinstance(state, str) and bool(state & self.final)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das transições atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Retorna o tamanho do cache e as contagens de acertos, faltas e descartes."""
+        return {
+            "cached_states": len(self.cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
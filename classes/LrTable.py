@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+
+class LrTable:
+    """Tabela LR com as ações e os desvios codificados como inteiros.
+
+    ``action[estado, terminal]`` guarda a ação codificada:
+
+    - ``0``: erro (célula vazia);
+    - ``j + 1``: empilha (shift) o estado ``j``;
+    - ``-(p + 1)``: reduz (reduce) pela produção ``p``;
+    - ``-1`` (``accept``): aceita, isto é, reduz pela produção 0 (``S' -> S``).
+
+    ``goto[estado, variável]`` guarda o estado de destino, ou -1 quando não há desvio.
+    """
+
+    error = 0
+    accept = -1
+
+    def __init__(
+        self,
+        states: list,
+        terminals: list,
+        nonterminals: list,
+        action: np.ndarray,
+        goto: np.ndarray,
+    ) -> None:
+        """Construtor da classe LrTable
+
+        Parameters
+        ----------
+        states : list
+            Rótulos dos estados, na ordem das linhas de ``action`` e ``goto``.
+        terminals : list
+            Terminais, na ordem das colunas de ``action``.
+        nonterminals : list
+            Variáveis, na ordem das colunas de ``goto``.
+        action : np.ndarray
+            Matriz ``int32`` (estados x terminais) com as ações codificadas.
+        goto : np.ndarray
+            Matriz ``int32`` (estados x variáveis) com os desvios.
+        """
+        self.states = list(states)
+        self.terminals = list(terminals)
+        self.nonterminals = list(nonterminals)
+        self.action = np.ascontiguousarray(action, dtype=np.int32)
+        self.goto = np.ascontiguousarray(goto, dtype=np.int32)
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.terminal_index = {symbol: i for i, symbol in enumerate(self.terminals)}
+        self.nonterminal_index = {
+            symbol: i for i, symbol in enumerate(self.nonterminals)
+        }
+
+    @classmethod
+    def shift(cls, state: int) -> int:
+        """Codifica a ação de empilhar o estado."""
+        return state + 1
+
+    @classmethod
+    def reduce(cls, production: int) -> int:
+        """Codifica a ação de reduzir pela produção."""
+        return -(production + 1)
+
+    @classmethod
+    def encode(cls, cell: str) -> int:
+        """Codifica uma célula da coluna ACTION no formato do site ("s2", "r3", "acc" ou vazia).
+
+        Raises
+        ------
+        ValueError
+            Se a célula não for uma ação conhecida.
+        """
+        cell = cell.strip()
+        if not cell:
+            return cls.error
+        if cell == "acc":
+            return cls.accept
+        if cell[0] == "s" and cell[1:].isdigit():
+            return cls.shift(int(cell[1:]))
+        if cell[0] == "r" and cell[1:].isdigit():
+            return cls.reduce(int(cell[1:]))
+        raise ValueError(f"Ação LR inválida: {cell!r}")
+
+    @classmethod
+    def decode(cls, code: int) -> str:
+        """Converte uma ação codificada de volta para o formato do site."""
+        if code == cls.error:
+            return ""
+        if code == cls.accept:
+            return "acc"
+        if code > 0:
+            return f"s{code - 1}"
+        return f"r{-code - 1}"
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Retorna a tabela como DataFrame de strings, apenas para visualização.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame com a coluna ``State``, uma coluna por terminal e uma por variável.
+        """
+        rows = [
+            [state]
+            + [self.decode(code) for code in action_row]
+            + [str(target) if target >= 0 else "" for target in goto_row]
+            for state, action_row, goto_row in zip(
+                self.states, self.action.tolist(), self.goto.tolist()
+            )
+        ]
+        return pd.DataFrame(
+            rows, columns=["State"] + self.terminals + self.nonterminals
+        )
@@ -1,7 +1,11 @@
 from io import StringIO
 
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup as bs
+from lxml import html as lxml_html
+
+from classes.LrTable import LrTable
 
 
 class LrTableConverter:
@@ -14,8 +18,22 @@ class LrTableConverter:
             Página HTML com a tabela LR.
         """
         self.html_webpage = html_webpage
-        self.soup = bs(html_webpage, "html.parser")
-        self.table = self.soup.find("div", {"id": "lrTableView"}).find("table")
+        self._soup = None
+        self._table = None
+
+    @property
+    def soup(self) -> bs:
+        """Página lida com o BeautifulSoup, criada no primeiro uso (só 'convert_to_csv' e afins precisam dela)."""
+        if self._soup is None:
+            self._soup = bs(self.html_webpage, "html.parser")
+        return self._soup
+
+    @property
+    def table(self):
+        """Elemento ``table`` da tabela LR, na árvore do BeautifulSoup."""
+        if self._table is None:
+            self._table = self.soup.find("div", {"id": "lrTableView"}).find("table")
+        return self._table
 
     def decompose_table(self):
         """Elimina as colunas ACTION, GOTO e LR table da tabela LR."""
@@ -58,4 +76,59 @@ class LrTableConverter:
         int
             Quantidade de colunas que são agrupadas na coluna GOTO.
         """
-        return self.table.find("th", string="GOTO").get("colspan")
\ No newline at end of file
+        return self.table.find("th", string="GOTO").get("colspan")
+
+    def to_lr_table(self) -> LrTable:
+        """Lê a tabela LR com o lxml, em uma única passada, direto para as matrizes de inteiros.
+
+        Não usa o BeautifulSoup nem o 'pd.read_html': as células são lidas uma vez e codificadas
+        com 'LrTable.encode' (ACTION) ou convertidas para o estado de destino (GOTO).
+
+        Returns
+        -------
+        LrTable
+            Tabela com as matrizes ``action`` e ``goto`` e os índices dos estados e símbolos.
+
+        Raises
+        ------
+        ValueError
+            Se a página não tiver a tabela LR ou se alguma célula for inválida.
+        """
+        document = lxml_html.fromstring(self.html_webpage)
+        tables = document.xpath('//div[@id="lrTableView"]//table')
+        if not tables:
+            raise ValueError("Tabela LR não encontrada na página")
+        table = tables[0]
+
+        action_length = int(
+            table.xpath('.//th[normalize-space()="ACTION"]/@colspan')[0]
+        )
+        symbols = [_text(th) for th in table.xpath("./thead/tr[last()]/th")]
+        terminals = symbols[:action_length]
+        nonterminals = symbols[action_length:]
+
+        rows = [
+            [_text(td) for td in tr.xpath("./td")] for tr in table.xpath("./tbody/tr")
+        ]
+        states = [int(row[0]) for row in rows]
+        state_index = {state: i for i, state in enumerate(states)}
+
+        action = np.zeros((len(rows), len(terminals)), dtype=np.int32)
+        goto = np.full((len(rows), len(nonterminals)), -1, dtype=np.int32)
+        for i, row in enumerate(rows):
+            for j, cell in enumerate(row[1 : action_length + 1]):
+                code = LrTable.encode(cell)
+                # Os destinos são rótulos de estado; as matrizes usam o número da linha
+                if code > 0:
+                    code = LrTable.shift(state_index[code - 1])
+                action[i, j] = code
+            for j, cell in enumerate(row[action_length + 1 :]):
+                if cell:
+                    goto[i, j] = state_index[int(cell)]
+
+        return LrTable(states, terminals, nonterminals, action, goto)
+
+
+def _text(element) -> str:
+    # '&nbsp;' vira '\xa0', que o strip() do Python também remove
+    return element.text_content().strip()
@@ -0,0 +1,171 @@
+import functools
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineReport:
+    """Relatório das etapas da construção do autômato.
+
+    Cada etapa é um dicionário no formato::
+
+        {
+            "stage": str,           # nome da função
+            "depth": int,           # nível de aninhamento (create_afnd chama replace_variables, ...)
+            "seconds": float,       # tempo de relógio
+            "peak_memory": int,     # pico de memória alocada durante a etapa, em bytes (ou None)
+            "states": int,          # estados da tabela retornada
+            "transitions": int,     # transições (estados destino) da tabela retornada
+            ...                     # contadores extras da etapa (ex.: "indeterminisms")
+        }
+    """
+
+    def __init__(self, memory: bool = False, log: bool = False) -> None:
+        """Construtor da classe PipelineReport
+
+        Parameters
+        ----------
+        memory : bool
+            Se True, mede o pico de memória de cada etapa com ``tracemalloc`` (mais lento).
+        log : bool
+            Se True, registra cada etapa no logger deste módulo, no nível INFO.
+        """
+        self.memory = memory
+        self.log = log
+        self.stages = []
+        self._stack = []  # Etapas em execução e o maior pico já visto em cada uma
+
+    @contextmanager
+    def stage(self, name: str):
+        """Mede uma etapa; o dicionário da etapa pode receber contadores extras durante a execução."""
+        data = {
+            "stage": name,
+            "depth": len(self._stack),
+            "seconds": None,
+            "peak_memory": None,
+        }
+        self.stages.append(data)
+
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+        entry = [data, 0]
+        self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield data
+        finally:
+            data["seconds"] = time.perf_counter() - start
+            self._stack.pop()
+            if self.memory:
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, entry[1])
+                data["peak_memory"] = peak - current
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+                tracemalloc.reset_peak()
+            if self.log:
+                logger.info(
+                    "%s%s: %s",
+                    "  " * data["depth"],
+                    name,
+                    ", ".join(
+                        f"{key}={value}"
+                        for key, value in data.items()
+                        if key not in ("stage", "depth") and value is not None
+                    ),
+                )
+
+    def count(self, **counters) -> None:
+        """Adiciona contadores à etapa em execução."""
+        if self._stack:
+            self._stack[-1][0].update(counters)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Retorna as etapas como DataFrame, uma linha por etapa, na ordem em que começaram."""
+        return pd.DataFrame(self.stages)
+
+
+_active_report = None
+
+
+@contextmanager
+def instrument(memory: bool = False, log: bool = False):
+    """Ativa a instrumentação das etapas decoradas com 'instrumented' dentro do bloco 'with'.
+
+    Parameters
+    ----------
+    memory : bool
+        Se True, mede o pico de memória de cada etapa com ``tracemalloc``.
+    log : bool
+        Se True, registra cada etapa no logger deste módulo.
+
+    Yields
+    ------
+    PipelineReport
+        Relatório preenchido à medida que as etapas terminam.
+    """
+    global _active_report
+    previous_report = _active_report
+    report = PipelineReport(memory, log)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _active_report = report
+    try:
+        yield report
+    finally:
+        _active_report = previous_report
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def count(**counters) -> None:
+    """Adiciona contadores à etapa em execução, se a instrumentação estiver ativa."""
+    if _active_report is not None:
+        _active_report.count(**counters)
+
+
+def table_size(table: pd.DataFrame) -> tuple:
+    """Retorna a quantidade de estados e de transições (estados destino) de uma tabela do autômato."""
+    cells = table[table.columns[1:]].to_numpy(dtype=object).ravel()
+    transitions = sum(
+        len([state for state in cell.split(",") if state])
+        for cell in cells
+        if isinstance(cell, str) and cell
+    )
+    return len(table), transitions
+
+
+def instrumented(function):
+    """Decora uma etapa do pipeline para ser medida quando a instrumentação estiver ativa.
+
+    Sem 'instrument' ativo, o custo é apenas uma verificação por chamada.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        report = _active_report
+        if report is None:
+            return function(*args, **kwargs)
+
+        with report.stage(function.__name__) as data:
+            result = function(*args, **kwargs)
+            table = result[0] if isinstance(result, tuple) else result
+            if isinstance(table, pd.DataFrame) and "sigma" in table.columns:
+                data["states"], data["transitions"] = table_size(table)
+            elif hasattr(table, "transition_count"):  # AutomatonBuilder
+                data["states"] = len(table.transitions)
+                data["transitions"] = table.transition_count()
+        return result
+
+    return wrapper
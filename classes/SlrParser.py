@@ -0,0 +1,157 @@
+from array import array
+
+from classes.LrTable import LrTable
+
+
+class SlrParser:
+    """Analisador SLR dirigido pela tabela de inteiros de 'LrTable'.
+
+    Os tokens são consumidos um a um de qualquer iterável (a fita do 'af_mapping', um gerador sobre
+    um arquivo, ...), então a entrada nunca precisa estar inteira na memória. A pilha de estados é
+    um ``array`` de inteiros e, no modo de validação (``build_tree=False``), nenhuma árvore é montada.
+    """
+
+    end_marker = "$"
+
+    def __init__(self, table: LrTable, productions: list) -> None:
+        """Construtor da classe SlrParser
+
+        Parameters
+        ----------
+        table : LrTable
+            Tabela LR com as matrizes ``action`` e ``goto``.
+        productions : list
+            Produções no formato ``(variável, [símbolos do lado direito])``, na ordem da numeração
+            usada nas reduções (a produção 0 é ``S' -> S``).
+        """
+        self.table = table
+        self.productions = [(lhs, list(rhs)) for lhs, rhs in productions]
+
+        # Versões em lista do Python das matrizes, indexadas por estado * largura + coluna
+        self._action = table.action.ravel().tolist()
+        self._goto = table.goto.ravel().tolist()
+        self._action_width = table.action.shape[1]
+        self._goto_width = table.goto.shape[1]
+        self._reductions = [
+            (len(rhs), table.nonterminal_index[lhs], lhs)
+            for lhs, rhs in self.productions
+        ]
+
+    @classmethod
+    def read_productions(cls, text: str) -> list:
+        """Lê as produções no formato do 'slr-grammar.txt', uma por linha (ex.: ``S -> if A then B C``).
+
+        Parameters
+        ----------
+        text : str
+            Texto com as produções; linhas vazias são ignoradas e ``ε`` (ou nada) no lado direito
+            indica a produção vazia.
+
+        Returns
+        -------
+        list
+            Lista de produções no formato ``(variável, [símbolos do lado direito])``.
+
+        Raises
+        ------
+        ValueError
+            Se alguma linha não tiver o ``->``.
+        """
+        productions = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            lhs, arrow, rhs = line.partition("->")
+            if not arrow:
+                raise ValueError(f"Produção inválida: {line!r}")
+            productions.append((
+                lhs.strip(),
+                [symbol for symbol in rhs.split() if symbol != "ε"],
+            ))
+        return productions
+
+    def expected(self, state: int) -> list:
+        """Retorna os terminais com ação definida no estado."""
+        row = self.table.action[state]
+        return [symbol for symbol, code in zip(self.table.terminals, row) if code]
+
+    def parse(self, tokens, build_tree: bool = True) -> dict:
+        """Analisa a sequência de tokens.
+
+        Parameters
+        ----------
+        tokens : iterable
+            Terminais da tabela LR, consumidos sob demanda. O marcador de fim (``$``) é opcional:
+            se o iterável acabar sem ele, o fim é adicionado.
+        build_tree : bool
+            Se True, monta a árvore sintática. Se False, apenas valida a entrada (mais rápido).
+
+        Returns
+        -------
+        dict
+            Resultado no formato::
+
+                {
+                    "accepted": bool,
+                    "position": int,      # índice do token em que o erro ocorreu, ou a quantidade de tokens
+                    "token": str,         # token inesperado, ou None se a entrada foi aceita
+                    "expected": list,     # terminais aceitos no ponto do erro
+                    "tree": tuple,        # (variável, [filhos]), com os terminais como folhas, ou None
+                }
+        """
+        action = self._action
+        goto = self._goto
+        action_width = self._action_width
+        goto_width = self._goto_width
+        reductions = self._reductions
+        terminal_index = self.table.terminal_index
+        accept = LrTable.accept
+
+        states = array("l", [0])
+        nodes = [] if build_tree else None
+        iterator = iter(tokens)
+        position = -1
+
+        def next_token():
+            nonlocal position
+            position += 1
+            return next(iterator, self.end_marker)
+
+        token = next_token()
+        while True:
+            column = terminal_index.get(token, -1)
+            code = action[states[-1] * action_width + column] if column >= 0 else 0
+
+            if code > 0:  # shift
+                states.append(code - 1)
+                if build_tree:
+                    nodes.append(token)
+                token = next_token()
+            elif code == accept:
+                return {
+                    "accepted": True,
+                    "position": position,
+                    "token": None,
+                    "expected": [],
+                    "tree": nodes[-1] if build_tree else None,
+                }
+            elif code < 0:  # reduce
+                length, lhs_index, lhs = reductions[-code - 1]
+                if length:
+                    del states[-length:]
+                if build_tree:
+                    children = nodes[len(nodes) - length :]
+                    del nodes[len(nodes) - length :]
+                    nodes.append((lhs, children))
+                target = goto[states[-1] * goto_width + lhs_index]
+                if target < 0:
+                    raise ValueError(f"Tabela LR sem desvio para {lhs!r}")
+                states.append(target)
+            else:
+                return {
+                    "accepted": False,
+                    "position": position,
+                    "token": token,
+                    "expected": self.expected(states[-1]),
+                    "tree": None,
+                }
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+from classes.CompiledAutomaton import _run_batch_jit
+from utils.all_functions import build_automaton, encode_batch, recognize_batch
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(_run_batch_jit is None, reason="Numba não instalado"),
+    ),
+]
+
+WORDS = [
+    "então",
+    "senão",
+    "aa",
+    "a",
+    "entao",
+    "sen",
+    "xyz",
+    "",
+    "ãa",
+    b"aa",
+    "então".encode(),
+]
+
+
+@pytest.fixture
+def automaton():
+    csv_df = pd.DataFrame(["então", "senão", "<S> ::= a<A>", "<A> ::= a<A> | ε"])
+    return build_automaton(csv_df)
+
+
+@pytest.mark.parametrize("jit", BACKENDS)
+def test_recognize_batch_matches_recognize_on_accented_words(automaton, jit):
+    expected = [
+        automaton.recognize(word if isinstance(word, str) else word.decode())
+        for word in WORDS
+    ]
+    assert not automaton.ascii
+    assert expected[:2] != ["Z", "Z"]
+    assert recognize_batch(WORDS, automaton, jit) == expected
+
+
+def test_run_batch_refuses_non_ascii_alphabet(automaton):
+    with pytest.raises(ValueError):
+        automaton.run_batch(*encode_batch(["então"]))
+
+
+@pytest.mark.parametrize("jit", BACKENDS)
+def test_recognize_batch_reads_accents_as_etc_on_ascii_alphabet(jit):
+    automaton = build_automaton(
+        pd.DataFrame(["se", "<S> ::= a<A>", "<A> ::= a<A> | ε"])
+    )
+    words = ["se", "sé", "aã", "aa", "ãã", "s"]
+    assert automaton.ascii
+    assert recognize_batch(words, automaton, jit) == [
+        automaton.recognize(word) for word in words
+    ]
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+import utils.all_functions as all_functions
+from classes.AutomatonCache import AutomatonCache
+from utils.all_functions import (
+    automaton_key,
+    compile_grammar,
+    load_automaton,
+    save_automaton,
+)
+
+GRAMMAR = pd.DataFrame(["se", "<S> ::= a<A>", "<A> ::= a<A> | ε"])
+
+
+def test_build_version_invalidates_the_disk_cache(tmp_path, monkeypatch):
+    compile_grammar(GRAMMAR, AutomatonCache(tmp_path))
+
+    cache = AutomatonCache(tmp_path)
+    compile_grammar(GRAMMAR, cache)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    key = automaton_key(GRAMMAR)
+    monkeypatch.setattr(all_functions, "BUILD_VERSION", all_functions.BUILD_VERSION + 1)
+    assert automaton_key(GRAMMAR) != key
+
+    cache = AutomatonCache(tmp_path)
+    compile_grammar(GRAMMAR, cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_load_rejects_another_build_version(tmp_path, monkeypatch):
+    path = tmp_path / "afd.afd"
+    save_automaton(compile_grammar(GRAMMAR, None), path, csv_df=GRAMMAR)
+    load_automaton(path, csv_df=GRAMMAR)
+
+    monkeypatch.setattr(all_functions, "BUILD_VERSION", all_functions.BUILD_VERSION + 1)
+    with pytest.raises(ValueError):
+        load_automaton(path, csv_df=GRAMMAR)
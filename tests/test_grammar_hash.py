@@ -0,0 +1,24 @@
+import pandas as pd
+
+from classes.Grammar import Grammar
+from utils.all_functions import grammar_hash
+
+GRAMMAR = ["se", "<S> ::= a<A>", "<A> ::= a<A> | ε"]
+
+
+def test_spacing_between_alternatives_keeps_the_hash():
+    spaced = ["se", "<S> ::= a<A>  ", "<A> ::= a<A>   |  ε"]
+    assert grammar_hash(pd.DataFrame(GRAMMAR)) == grammar_hash(pd.DataFrame(spaced))
+
+
+def test_spacing_that_changes_the_parse_changes_the_hash():
+    # Com dois espaços antes do '::=', a linha não é uma regra e vira palavra reservada
+    spaced = ["se", "<S>  ::= a<A>", "<A> ::= a<A> | ε"]
+    assert Grammar.from_lines(spaced).reserved_words == ["se", "<S>  ::= a<A>"]
+    assert grammar_hash(pd.DataFrame(GRAMMAR)) != grammar_hash(pd.DataFrame(spaced))
+
+
+def test_hash_accepts_a_parsed_grammar():
+    assert grammar_hash(Grammar.from_lines(GRAMMAR)) == grammar_hash(
+        pd.DataFrame(GRAMMAR)
+    )
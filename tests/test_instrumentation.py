@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pandas as pd
+
+from classes.PipelineReport import instrument
+from utils.all_functions import build_automaton
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+
+def test_grammar_counters_belong_to_create_afnd():
+    csv_df = pd.read_csv(INPUTS / "entrada.csv", header=None)
+    with instrument() as report:
+        build_automaton(csv_df)
+
+    stages = {stage["stage"]: stage for stage in report.stages}
+    assert stages["create_afnd"]["reserved_words"] == 5
+    assert stages["create_afnd"]["rules"] == 0
+    assert "reserved_words" not in stages["build_automaton"]
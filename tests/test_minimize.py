@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from utils.all_functions import (
+    compile_afd,
+    create_afnd,
+    determinize_afnd,
+    error_states,
+    minimize_afd,
+    remove_dead_states,
+    remove_unreachable_states,
+)
+
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+
+@pytest.fixture
+def afd():
+    csv_df = pd.read_csv(INPUTS / "entrada.csv", header=None)
+    afnd_df, final_states = create_afnd(csv_df)
+    afnd_df = remove_unreachable_states(afnd_df)
+    afnd_df = remove_dead_states(afnd_df, final_states)
+    afd_df, final_states = determinize_afnd(csv_df, afnd_df, final_states)
+    return error_states(afd_df, final_states)
+
+
+@pytest.mark.parametrize("partition_finals", [True, False])
+def test_error_states_keep_their_own_blocks(afd, partition_finals):
+    afd_df, final_states = afd
+    min_df, min_finals, mapping = minimize_afd(
+        afd_df.copy(), list(final_states), partition_finals=partition_finals
+    )
+
+    assert mapping["&"] == "&"
+    assert mapping["Z"] == "Z"
+    assert [state for state, block in mapping.items() if block in ("&", "Z")] == [
+        "&",
+        "Z",
+    ]
+
+    minimized = compile_afd(min_df, min_finals)
+    assert minimized.recognize("xyz") == "Z"
+    assert minimized.recognize("iff") == "&"
+    assert minimized.recognize("if") == mapping["B"]
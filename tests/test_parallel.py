@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.all_functions import (
+    build_automaton,
+    load_automaton,
+    parallel_trace,
+    save_automaton,
+)
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+WORDS = ["if", "else", "then", "act", "cdt", "iff", "xyz", "", "elsa"] * 50
+
+
+def test_mapped_table_is_read_without_a_copy(tmp_path):
+    automaton = build_automaton(pd.read_csv(INPUTS / "entrada.csv", header=None))
+    path = tmp_path / "afd.afd"
+    save_automaton(automaton, path)
+    mapped = load_automaton(path, mmap=True)
+
+    assert [mapped.trace(word) for word in WORDS] == [
+        automaton.trace(word) for word in WORDS
+    ]
+    assert isinstance(mapped.table, np.memmap)
+    assert isinstance(mapped._delta, memoryview)
+
+
+def test_parallel_trace_matches_trace():
+    automaton = build_automaton(pd.read_csv(INPUTS / "entrada.csv", header=None))
+    assert parallel_trace(WORDS, automaton, workers=2, shard_size=100) == [
+        automaton.trace(word) for word in WORDS
+    ]
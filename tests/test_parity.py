@@ -0,0 +1,232 @@
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmarks.generators import generate_grammar
+from classes.CompiledAutomaton import _run_batch_jit
+from classes.Grammar import Grammar
+from utils.all_functions import (
+    build_automaton,
+    compile_afd,
+    compile_recognizer,
+    create_afnd,
+    determinize_afnd,
+    error_states,
+    lazy_automaton,
+    load_automaton,
+    minimize_afd,
+    parse_grammar,
+    recognize_batch,
+    remove_dead_states,
+    remove_unreachable_states,
+    save_automaton,
+)
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+GRAMMARS = {
+    "entrada": lambda: pd.read_csv(INPUTS / "entrada.csv", header=None),
+    "epsilon": lambda: pd.DataFrame(
+        [
+            "se",
+            "<S> ::= a<A> | <B>",
+            "<A> ::= b<A> | ε",
+            "<B> ::= c<B> | d<C> | <A>",
+            "<C> ::= ε",
+        ]
+    ),
+    "acentos": lambda: pd.DataFrame(
+        [
+            "então",
+            "senão",
+            "<S> ::= a<A> | ã<S>",
+            "<A> ::= a<A> | ε",
+        ]
+    ),
+    # O símbolo inicial aparece do lado direito e tem a alternativa 'ε'
+    "recursiva": lambda: pd.DataFrame(
+        ["se", "<S> ::= a<S> | b<A> | ε", "<A> ::= b<A> | ε"]
+    ),
+    # '<A>' só aparece do lado esquerdo e não pode se juntar ao estado 'A' da trie de 'cab'
+    "colisao": lambda: pd.DataFrame(["cab", "<S> ::= a<D>", "<D> ::= ε", "<A> ::= ε"]),
+    # Mais de 24 estados, então o AFD tem estados com nomes de várias letras
+    "sintetica": lambda: generate_grammar(30, n_productions=20, seed=1),
+}
+
+
+def nfa_acceptor(afnd_df: pd.DataFrame, final_states: list):
+    """Simulação direta do AFND de 'create_afnd', com os fechos-ε, usada como referência."""
+    rows = {row["sigma"]: row for row in afnd_df.to_dict("records")}
+    symbols = set(afnd_df.columns[1:]) - {Grammar.epsilon}
+    final_states = set(final_states)
+
+    def targets(states, symbol):
+        found = set()
+        for state in states:
+            cell = rows[state].get(symbol)
+            if isinstance(cell, str) and cell:
+                found.update(cell.split(","))
+        return found
+
+    def closure(states):
+        states = set(states)
+        pending = list(states)
+        while pending:
+            for target in targets([pending.pop()], Grammar.epsilon):
+                if target not in states:
+                    states.add(target)
+                    pending.append(target)
+        return states
+
+    def accepts(word: str) -> bool:
+        current = closure({"S"})
+        for char in word:
+            if char not in symbols:
+                return False
+            current = closure(targets(current, char))
+        return bool(current & final_states)
+
+    return accepts
+
+
+def sample_words(csv_df: pd.DataFrame, count: int = 300, seed: int = 0) -> list:
+    grammar = parse_grammar(csv_df)
+    letters = list(grammar.terminals) + ["x", "9"]
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choice(letters) for _ in range(rng.randint(0, 8)))
+        for _ in range(count)
+    ]
+    words += grammar.reserved_words + [
+        word + word[-1] for word in grammar.reserved_words
+    ]
+    return words
+
+
+@pytest.fixture(scope="module", params=list(GRAMMARS))
+def case(request):
+    csv_df = GRAMMARS[request.param]()
+    afnd_df, final_states = create_afnd(csv_df)
+    words = sample_words(csv_df)
+    nfa_accepts = nfa_acceptor(afnd_df, final_states)
+    expected = [nfa_accepts(word) for word in words]
+    assert any(expected) and not all(expected)
+
+    trimmed = remove_unreachable_states(afnd_df)
+    trimmed = remove_dead_states(trimmed, final_states)
+    afd_df, afd_finals = determinize_afnd(csv_df, trimmed, final_states)
+    afd_df, afd_finals = error_states(afd_df, afd_finals)
+    return {
+        "csv_df": csv_df,
+        "afnd_df": trimmed,
+        "final_states": final_states,
+        "afd_df": afd_df,
+        "afd_finals": afd_finals,
+        "words": words,
+        "expected": expected,
+    }
+
+
+def accepts(automaton, word) -> bool:
+    state = automaton.run(word)
+    return state >= 0 and bool(automaton.accepting[state])
+
+
+def test_afd_matches_nfa(case):
+    afd = compile_afd(case["afd_df"], case["afd_finals"])
+    assert [accepts(afd, word) for word in case["words"]] == case["expected"]
+
+
+@pytest.mark.parametrize("partition_finals", [True, False])
+def test_minimized_afd_matches_nfa(case, partition_finals):
+    min_df, min_finals, _ = minimize_afd(
+        case["afd_df"].copy(), list(case["afd_finals"]), partition_finals
+    )
+    minimized = compile_afd(min_df, min_finals)
+    assert [accepts(minimized, word) for word in case["words"]] == case["expected"]
+
+
+@pytest.mark.parametrize("max_states", [0, 2, 4096])
+def test_lazy_automaton_matches_nfa(case, max_states):
+    lazy = lazy_automaton(case["afnd_df"], case["final_states"], max_states)
+    assert [lazy.is_final(word) for word in case["words"]] == case["expected"]
+
+    afd = compile_afd(case["afd_df"], case["afd_finals"])
+    assert [lazy.recognize(word) for word in case["words"]] == [
+        afd.recognize(word) for word in case["words"]
+    ]
+
+
+def test_generated_module_matches_nfa(case, tmp_path):
+    module = compile_recognizer(case["csv_df"], tmp_path)
+    assert [module.accepts(word) for word in case["words"]] == case["expected"]
+
+
+@pytest.mark.parametrize(
+    "jit",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                _run_batch_jit is None, reason="Numba não instalado"
+            ),
+        ),
+    ],
+)
+def test_recognize_batch_matches_nfa(case, jit):
+    automaton = build_automaton(case["csv_df"])
+    accepting = {
+        state
+        for state, final in zip(automaton.states, automaton.accepting.tolist())
+        if final
+    }
+    names = recognize_batch(case["words"], automaton, jit)
+    assert [name in accepting for name in names] == case["expected"]
+    assert names == [automaton.recognize(word) for word in case["words"]]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(case, tmp_path, mmap):
+    automaton = build_automaton(case["csv_df"])
+    path = tmp_path / "afd.afd"
+    save_automaton(automaton, path, csv_df=case["csv_df"])
+    loaded = load_automaton(path, csv_df=case["csv_df"], mmap=mmap)
+
+    assert loaded.states == automaton.states
+    assert loaded.symbols == automaton.symbols
+    assert loaded.classes == automaton.classes
+    assert (loaded.table == automaton.table).all()
+    assert (loaded.final == automaton.final).all()
+    assert [loaded.recognize(word) for word in case["words"]] == [
+        automaton.recognize(word) for word in case["words"]
+    ]
+    assert [accepts(loaded, word) for word in case["words"]] == case["expected"]
+
+
+def test_load_rejects_another_grammar(tmp_path):
+    path = tmp_path / "afd.afd"
+    save_automaton(
+        build_automaton(GRAMMARS["entrada"]()), path, csv_df=GRAMMARS["entrada"]()
+    )
+    with pytest.raises(ValueError):
+        load_automaton(path, csv_df=GRAMMARS["epsilon"]())
+
+
+@pytest.mark.parametrize(
+    "grammar, accepted, rejected",
+    [
+        (
+            "recursiva",
+            ["", "a", "aa", "ab", "abb", "b", "se"],
+            ["ba", "s", "sea", "c"],
+        ),
+        ("colisao", ["cab", "a"], ["", "c", "ca", "aa", "b"]),
+    ],
+)
+def test_rule_variables_accept_their_language(grammar, accepted, rejected):
+    automaton = build_automaton(GRAMMARS[grammar]())
+    assert all(accepts(automaton, word) for word in accepted)
+    assert not any(accepts(automaton, word) for word in rejected)
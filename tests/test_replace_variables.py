@@ -0,0 +1,30 @@
+import pandas as pd
+
+from classes.AutomatonBuilder import AutomatonBuilder
+from utils.all_functions import (
+    build_reserved_words_trie,
+    parse_grammar,
+    replace_variables,
+)
+
+
+def rename(lines):
+    grammar = parse_grammar(pd.DataFrame(lines))
+    _, _, last_state = build_reserved_words_trie(grammar)
+    builder = AutomatonBuilder(grammar.terminals)
+    _, renamed = replace_variables(builder, grammar, last_state)
+    return renamed.rule_words()
+
+
+def test_start_symbol_keeps_its_state_when_it_recurses():
+    assert rename(["se", "<S> ::= a<S> | ε"]) == [["<S>", "::=", "a<S>", "|", "ε"]]
+
+
+def test_left_hand_side_only_variables_get_fresh_states():
+    # A trie usa os estados A, B e C; '<A>' não pode se juntar ao estado 'A' da palavra 'cab'
+    words = rename(["cab", "<S> ::= a<D>", "<D> ::= ε", "<A> ::= ε"])
+    assert words == [
+        ["<S>", "::=", "a<D>"],
+        ["<D>", "::=", "ε"],
+        ["<E>", "::=", "ε"],
+    ]
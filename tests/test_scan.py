@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from utils.all_functions import build_automaton, scan_file, scan_lines
+
+INPUTS = Path(__file__).resolve().parent.parent / "inputs"
+
+
+def tokens_by_text(path, tokens):
+    data = Path(path).read_bytes()
+    return [(data[start:end].decode("utf-8"), state) for start, end, state in tokens]
+
+
+def tokens_by_line(path, automaton):
+    lines = Path(path).read_text(encoding="utf-8").splitlines(keepends=True)
+    return [
+        (lines[line_index - 1][start:end], state)
+        for line_index, start, end, state in scan_lines(path, automaton)
+    ]
+
+
+@pytest.mark.parametrize(
+    "grammar, text",
+    [
+        (
+            ["então", "senão", "<S> ::= a<A>", "<A> ::= a<A> | ε"],
+            "então senão\naa então\nsenãoaa  xentão\n",
+        ),
+        (None, "if cdt then act\nelse act\nifx cdt\n"),
+    ],
+)
+def test_scan_file_matches_scan_lines(tmp_path, grammar, text):
+    csv_df = (
+        pd.read_csv(INPUTS / "entrada.csv", header=None)
+        if grammar is None
+        else pd.DataFrame(grammar)
+    )
+    automaton = build_automaton(csv_df)
+    path = tmp_path / "entrada.txt"
+    path.write_text(text, encoding="utf-8")
+
+    tokens = tokens_by_text(path, scan_file(path, automaton))
+    assert tokens == tokens_by_line(path, automaton)
+    if grammar is not None:
+        assert [token for token, _ in tokens[:2]] == ["então", "senão"]
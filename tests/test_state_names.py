@@ -0,0 +1,59 @@
+import pandas as pd
+
+from classes.Alphabet import Alphabet
+from utils.all_functions import (
+    compile_afd,
+    determinize_afnd,
+    error_states,
+    lazy_automaton,
+)
+
+
+def two_letter_afnd():
+    """AFND em que {A, B, C}, {A, BC} e {AB, C} teriam o mesmo nome "[ABC]" sem separador."""
+    afnd_df = pd.DataFrame(
+        [
+            ["S", "A,B,C", "A,BC", "AB,C", ""],
+            ["A", "", "", "", ""],
+            ["B", "", "", "", ""],
+            ["C", "", "", "", ""],
+            ["AB", "", "", "", ""],
+            ["BC", "", "", "", "BC"],
+        ],
+        columns=["sigma", "x", "y", "z", "c"],
+    )
+    return afnd_df, ["C", "BC"]
+
+
+def test_subset_name_separates_multi_letter_states():
+    assert Alphabet.subset_name(["A"]) == "A"
+    assert Alphabet.subset_name(["A", "H"]) == "[AH]"
+    assert Alphabet.subset_name(["A", "BC"]) == "[A.BC]"
+    assert Alphabet.subset_name(["AB", "C"]) == "[AB.C]"
+
+
+def test_determinize_keeps_subsets_with_two_letter_states_apart():
+    afnd_df, final_states = two_letter_afnd()
+    afd_df, final_states = determinize_afnd(None, afnd_df, final_states)
+
+    assert afd_df["sigma"].is_unique
+    assert {"[ABC]", "[A.BC]", "[C.AB]"} <= set(afd_df["sigma"])
+
+    afd_df, final_states = error_states(afd_df, final_states)
+    afd = compile_afd(afd_df, final_states)
+    assert afd.recognize("xc") == "&"
+    assert afd.recognize("yc") == "BC"
+    assert afd.recognize("zc") == "&"
+    assert afd.is_final(afd.run("z"))
+
+
+def test_lazy_automaton_uses_the_same_names():
+    afnd_df, final_states = two_letter_afnd()
+    lazy = lazy_automaton(afnd_df, final_states)
+    afd_df, afd_finals = error_states(
+        *determinize_afnd(None, afnd_df, final_states)
+    )
+    afd = compile_afd(afd_df, afd_finals)
+
+    for word in ["x", "y", "z", "xc", "yc", "ycc", "zc", "q"]:
+        assert lazy.recognize(word) == afd.recognize(word)
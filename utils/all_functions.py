@@ -1,10 +1,43 @@
-import string
+import codecs
+import hashlib
+import importlib.util
+import json
+import mmap
+import os
+import tempfile
 from collections import OrderedDict as od
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import pandas as pd
 
 from classes.Alphabet import alphabet
-from classes.RegexPatterns import patterns
+from classes.AutomatonBuilder import AutomatonBuilder
+from classes.AutomatonCache import AutomatonCache, automaton_cache
+from classes.CompiledAutomaton import CompiledAutomaton
+from classes.Grammar import Grammar
+from classes.LazyAutomaton import LazyAutomaton
+from classes.PipelineReport import count, instrumented
+from classes.SlrParser import SlrParser
+
+
+def parse_grammar(csv_df):
+    """
+    Lê a gramática uma única vez, para ser reaproveitada pelas etapas seguintes.
+
+    Parâmetros:
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo as strings da gramática, ou uma 'Grammar' já lida.
+
+    Retorna:
+    Grammar: A gramática lida (a própria 'Grammar' recebida, se for o caso).
+
+    Nota:
+    - As funções que recebem 'csv_df' também aceitam a 'Grammar', evitando reler o texto a cada etapa.
+    """
+    if isinstance(csv_df, Grammar):
+        return csv_df
+    return Grammar.from_dataframe(csv_df)
 
 
 def extract_terminals(csv_df):
@@ -12,16 +45,13 @@ def extract_terminals(csv_df):
     Extrai as letras terminais das palavras reservadas obtidas ao analisar um DataFrame contendo strings.
 
     Parâmetros:
-    - csv_df (pandas.DataFrame): O DataFrame contendo strings a serem analisadas.
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
 
     Retorna:
     lista: Uma lista de letras terminais individuais obtidas das palavras reservadas.
     """
     terminal_letters = [
-        c
-        for word in (row["word"] for row in reserved_words_and_counts(csv_df))
-        for char in word
-        for c in char
+        char for word in parse_grammar(csv_df).reserved_words for char in word
     ]
     return terminal_letters
 
@@ -31,26 +61,16 @@ def unique_terminal_letters(csv_df):
     Extrai letras terminais únicas de um DataFrame contendo strings.
 
     Parâmetros:
-    - csv_df (pandas.DataFrame): O DataFrame contendo strings a serem analisadas.
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
 
     Retorna:
     lista: Uma lista de letras terminais únicas encontradas nas strings.
 
     Nota:
     - A função ignora letras maiúsculas, 'ε' (épsilon) e caracteres não alfabéticos.
-    - Utiliza o 'collections.OrderedDict' para preservar a ordem das letras terminais únicas.
+    - As letras são coletadas, na ordem em que aparecem, durante a leitura da gramática ('parse_grammar').
     """
-    terminal_letters = list(
-        od.fromkeys(
-            (
-                c
-                for row in csv_df.values
-                for char in row
-                for c in char
-                if c.islower() and c != "ε"
-            )
-        )
-    )
+    terminal_letters = list(parse_grammar(csv_df).terminals)
     return terminal_letters
 
 
@@ -59,7 +79,7 @@ def reserved_words_and_counts(csv_df):
     Analisa um DataFrame contendo strings e extrai palavras reservadas, juntamente com suas contagens de caracteres.
 
     Parâmetros:
-    - csv_df (pandas.DataFrame): O DataFrame contendo strings a serem analisadas.
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
 
     Retorna:
     lista: Uma lista de dicionários, cada um contendo informações sobre uma palavra reservada, incluindo a própria palavra
@@ -71,18 +91,13 @@ def reserved_words_and_counts(csv_df):
         ]
 
     Nota:
-    - Palavras reservadas são identificadas como strings em minúsculas, excluindo o caractere '<'.
+    - Palavras reservadas são as linhas que não são regras ('<X> ::= ...').
     - A função calcula o tamanho (contagem de caracteres) de cada palavra reservada.
     - A lista retornada contém dicionários com informações sobre cada palavra reservada e seu tamanho.
     """
-    reserved_words = [
-        row for row in csv_df.values for char in row if not patterns.variable(char)
-    ]
-    size = [len(c) for word in reserved_words for c in word]
-
     json_data = []
-    for word, size in zip(reserved_words, size):
-        json = {"word": word, "size": size}
+    for word in parse_grammar(csv_df).reserved_words:
+        json = {"word": word, "size": len(word)}
         json_data.append(json)
 
     return json_data
@@ -110,10 +125,9 @@ def create_afnd_skeleton(csv_df):
     )
     afnd_skeleton_df.at[0, "sigma"] = "S"
 
-    alphabet = list(string.ascii_uppercase)
     size = len(extract_terminals(csv_df))
 
-    symbols = [symbol for letters in alphabet[:size] for symbol in letters]
+    symbols = [alphabet.index_to_letter(i) for i in range(size)]
     for i, symbol in enumerate(symbols):
         afnd_skeleton_df.at[i + 1, "sigma"] = symbol
 
@@ -127,7 +141,7 @@ def extract_variables_df(csv_df):
     Extrai informações sobre variáveis de um DataFrame contendo strings.
 
     Parâmetros:
-    - csv_df (pandas.DataFrame): O DataFrame contendo strings a serem analisadas.
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
 
     Retorna:
     lista: Uma lista de dicionários, cada um contendo informações sobre uma variável, incluindo o símbolo,
@@ -139,19 +153,16 @@ def extract_variables_df(csv_df):
         ]
 
     Nota:
-    - A função utiliza expressões regulares para encontrar padrões de símbolos e variáveis nas strings do DataFrame.
+    - As regras vêm da gramática já lida ('parse_grammar'), sem aplicar as expressões regulares de novo.
     - O resultado é uma lista de dicionários contendo informações sobre cada variável encontrada.
     """
-
-    lines = [str(row) for row in csv_df.values for char in row if patterns.symbol(char)]
     rg = []
 
-    for line in lines:
-        symbol = [
-            match[1] for match in patterns.symbol(line) if patterns.variable(line)
-        ]
-        terminals = [match[0] for match in patterns.variable(line)]
-        variables = [match[1] for match in patterns.variable(line)]
+    for rule in parse_grammar(csv_df).rules:
+        pairs = [pair for transitions in rule["transitions"] for pair in transitions]
+        symbol = [rule["symbol"]] if pairs else []
+        terminals = [terminal for terminal, _ in pairs]
+        variables = [variable for _, variable in pairs]
 
         json = {"symbol": symbol, "terminals": terminals, "variables": variables}
         rg.append(json)
@@ -163,7 +174,7 @@ def extract_variables_list(words):
     Extrai informações sobre variáveis de uma lista de palavras.
 
     Parâmetros:
-    - words (list): A lista de palavras a serem analisadas.
+    - words (list | Grammar): A lista de palavras a serem analisadas, ou a 'Grammar' já lida.
 
     Retorna:
     lista: Uma lista de dicionários, cada um contendo informações sobre uma variável, incluindo o símbolo,
@@ -175,137 +186,87 @@ def extract_variables_list(words):
         ]
 
     Nota:
-    - A função utiliza expressões regulares para encontrar padrões de símbolos e variáveis na lista de palavras.
+    - As palavras de cada regra são lidas uma única vez pela 'Grammar', com expressões regulares pré-compiladas.
     - Os símbolos são identificados com base nos valores adjacentes à ocorrência do "::=" na lista.
     - Os resultados são organizados em uma lista de dicionários, cada um representando uma variável.
     """
-    symbols = [
-        letter
-        for word in words
-        for string in word
-        if not patterns.variable(string) and patterns.symbol_alt(string)
-        for letter in string
-        if letter.isalpha()
-    ]
+    grammar = rules_grammar(words)
     rg = []
 
-    for i, symbol in enumerate(symbols):
-        terminals = []
-        variables = []
-        for j, word in enumerate(words[i]):
-            if not patterns.variable(word):
-                continue
-            terminals.append([
-                match[0]
-                for match in patterns.variable(word)
-                if patterns.variable(word) is not None
-            ])
-            variables.append([
-                match[1]
-                for match in patterns.variable(word)
-                if patterns.variable(word) is not None
-            ])
-        json = {"symbol": symbol, "terminals": terminals, "variables": variables}
+    for rule in grammar.rules:
+        transitions = [pairs for pairs in rule["transitions"] if pairs]
+        terminals = [[terminal for terminal, _ in pairs] for pairs in transitions]
+        variables = [[variable for _, variable in pairs] for pairs in transitions]
+        json = {
+            "symbol": rule["symbol"],
+            "terminals": terminals,
+            "variables": variables,
+        }
         rg.append(json)
     return rg
 
 
-def replace_variables(afnd_df, csv_df, last_state):
-    alphabet = list(string.ascii_uppercase)
+def rules_grammar(words) -> Grammar:
+    """Esta função retorna a 'Grammar' das regras, lendo as listas de palavras apenas se ainda não for uma.
 
-    old_variables = list(
-        od.fromkeys(
-            variable
-            for line in extract_variables_df(csv_df)
-            for variable in line["variables"]
-        )
-    )
-    new_states_count = len(old_variables)
-    index_last_state = alphabet.index(last_state) + 1
-    total = new_states_count + index_last_state
-    new_symbols = [
-        symbol for letters in alphabet[index_last_state:total] for symbol in letters
-    ]
+    Args:
+        words (list | Grammar): Regras como listas de palavras (ex.: ['<S>', '::=', 'a<A>']) ou a 'Grammar'.
 
-    # Update the "sigma" column in afnd_df starting from the end
-    for i, symbol in enumerate(new_symbols, start=index_last_state):
-        afnd_df.at[i + 1, "sigma"] = symbol
-
-    sentences = [
-        str(word)
-        for row in csv_df.values
-        for char in row
-        if patterns.symbol(char)
-        for sentence in row
-        for word in sentence.split()
-    ]
-    new_sentences = sentences.copy()
-
-    new_variables = []
-
-    for i in range(new_states_count):
-        for j, word in enumerate(new_sentences):
-            match = patterns.variable(word)
-            if not match:
-                continue
-            for m in match:
-                if m[1] == old_variables[i]:
-                    new_sentences[j] = f"{m[0]}<{new_symbols[i]}>"
-                    json_data = {
-                        "old_variable": old_variables[i],
-                        "new_variable": new_symbols[i],
-                    }
-                    new_variables.append(json_data)
-
-    new_variables = [
-        dict(t)
-        for t in {
-            tuple(d.items())
-            # remove duplicates
-            for d in new_variables
-        }
-    ]
-    # sort by new variable
-    new_variables = sorted(new_variables, key=lambda k: k["new_variable"])
+    Returns:
+        Grammar: A própria 'Grammar' recebida, ou a gramática lida das listas de palavras.
+    """
+    if isinstance(words, Grammar):
+        return words
+    return Grammar.from_lines(" ".join(str(word) for word in rule) for rule in words)
 
-    symbols = [
-        word
-        for word in new_sentences
-        if not patterns.variable(word) and patterns.symbol_alt(word)
-    ]
 
-    # recria a nested list, não sei como funciona "copilot fez"
-    def recreate_nested_structure(new_sentences, symbols):
-        nested_list = []
+@instrumented
+def replace_variables(afnd_df, csv_df, last_state):
+    """
+    Renomeia as variáveis da gramática para novos estados, criados a partir do último estado das palavras reservadas.
 
-        for i, symbol in enumerate(symbols):
-            words = []
-            for j, word in enumerate(new_sentences):
-                if i == len(symbols) - 1:
-                    if j > new_sentences.index(symbol):
-                        words.append(word)
-                else:
-                    if j > new_sentences.index(symbol) and j < new_sentences.index(
-                        symbols[i + 1]
-                    ):
-                        words.append(word)
-            words.insert(0, symbol)
-            nested_list.append(words)
-
-        return nested_list
-
-    new_words = recreate_nested_structure(new_sentences, symbols)
-
-    for data in new_variables:
-        for i, words in enumerate(new_words):
-            new_words[i] = [
-                word.replace(f'<{data["old_variable"]}>', f'<{data["new_variable"]}>')
-                for word in words
-            ]
+    Parâmetros:
+    - afnd_df (pandas.DataFrame | AutomatonBuilder): O AFND, como DataFrame ou como 'AutomatonBuilder'.
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
+    - last_state (str): O último estado criado pelas palavras reservadas, ou None.
+
+    Retorna:
+    tuple: Tupla com o AFND (do mesmo tipo recebido) com os novos estados e a 'Grammar' com as regras
+        reescritas. As regras no formato antigo, uma lista de palavras por regra, vêm de 'rule_words()'.
 
-    afnd_df = afnd_df.fillna("")
+    Nota:
+    - O mapa variável antiga -> novo estado é montado uma única vez e as regras são reescritas em uma
+      única passada ('Grammar.rename'), sem ler o texto das regras de novo.
+    - O mapa cobre as variáveis dos dois lados das regras: o símbolo inicial 'S' continua sendo o estado 'S'
+      (mesmo quando aparece do lado direito) e todas as outras recebem estados novos, então nenhuma delas
+      se junta a um estado da trie de mesmo nome.
+    """
+    grammar = parse_grammar(csv_df)
+    old_variables = [
+        variable
+        for variable in od.fromkeys(
+            grammar.variables + [rule["symbol"] for rule in grammar.rules]
+        )
+        if variable != "S"
+    ]
+    index_last_state = alphabet.letter_to_index(last_state) + 1 if last_state else 0
+    new_symbols = [
+        alphabet.index_to_letter(i)
+        for i in range(index_last_state, index_last_state + len(old_variables))
+    ]
 
-    return afnd_df, new_words
+    if isinstance(afnd_df, AutomatonBuilder):
+        for symbol in new_symbols:
+            afnd_df.add_state(symbol)
+    else:
+        # Update the "sigma" column in afnd_df starting from the end
+        for i, symbol in enumerate(new_symbols, start=index_last_state):
+            afnd_df.at[i + 1, "sigma"] = symbol
+        afnd_df = afnd_df.fillna("")
+
+    # Tabela de símbolos: cada variável é renomeada uma única vez, sem renomeações em cadeia
+    renamed = grammar.rename({"S": "S", **dict(zip(old_variables, new_symbols))})
+    return afnd_df, renamed
 
 
 def insert_value_df(df, search_column, search_row, target_column, value):
@@ -332,121 +293,118 @@ def insert_value_df(df, search_column, search_row, target_column, value):
     return df
 
 
+@instrumented
 def populate_variables(afnd_df, words):
     """
     Preenche o AFND (Autômato Finito Não Determinístico) com informações sobre variáveis.
 
     Parâmetros:
-    - afnd_df (pandas.DataFrame): O DataFrame representando o AFND.
-    - words (list): A lista de palavras contendo informações sobre variáveis.
+    - afnd_df (pandas.DataFrame | AutomatonBuilder): O AFND, como DataFrame ou como 'AutomatonBuilder'.
+    - words (list | Grammar): A 'Grammar' com as regras reescritas ('replace_variables'), ou as regras como
+      listas de palavras.
 
     Retorna:
-    pandas.DataFrame: O DataFrame do AFND atualizado com informações sobre variáveis.
+    pandas.DataFrame | AutomatonBuilder: O AFND (do mesmo tipo recebido) atualizado com informações sobre variáveis.
 
     Nota:
-    - A função extrai informações sobre variáveis a partir da lista de palavras e popula as células correspondentes no AFND.
-    - Os dados são preenchidos nas células do AFND de acordo com as informações sobre variáveis encontradas.
-    """
-    new_variables = extract_variables_list(words)
-
-    for new_variable in new_variables:
-        for i, terminals, variables in zip(
-            range(len(new_variable["terminals"])),
-            new_variable["terminals"],
-            new_variable["variables"],
-        ):
-            for terminal, variable in zip(terminals, variables):
-                afnd_df = insert_value_df(
-                    afnd_df, "sigma", new_variable["symbol"], terminal, variable
-                )
-    return afnd_df
+    - As transições (terminal, variável) de cada regra vêm direto da 'Grammar'; listas de palavras são lidas uma vez.
+    - As transições são acumuladas em um 'AutomatonBuilder'; um DataFrame recebido é lido e montado uma única vez.
+    """
+    grammar = rules_grammar(words)
+    builder = (
+        afnd_df
+        if isinstance(afnd_df, AutomatonBuilder)
+        else AutomatonBuilder.from_dataframe(afnd_df)
+    )
+
+    for rule in grammar.rules:
+        for pairs in rule["transitions"]:
+            for terminal, variable in pairs:
+                builder.add_edge(rule["symbol"], terminal, variable)
+
+    if isinstance(afnd_df, AutomatonBuilder):
+        return builder
+    return builder.to_dataframe()
 
 
+def build_reserved_words_trie(csv_df) -> tuple:
+    """
+    Insere as palavras reservadas em uma árvore de prefixos (trie), compartilhando os estados dos prefixos comuns.
+
+    Parâmetros:
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
+
+    Retorna:
+    tuple: Tupla com a trie no formato {estado: {caractere: próximo estado}}, a lista de estados finais
+        e o último estado criado (None se não houver palavras reservadas).
+
+    Nota:
+    - Palavras com o mesmo prefixo (ex.: "se" e "senao") percorrem os mesmos estados, então o AFND
+      das palavras reservadas já sai determinístico.
+    - Os estados são criados na ordem em que as palavras aparecem, usando o 'alphabet'.
+    """
+    trie = {"S": {}}
+    final_states = []
+    next_index = 0
+
+    for word in parse_grammar(csv_df).reserved_words:
+        state = "S"
+        for char in word:
+            if char not in trie[state]:
+                new_state = alphabet.index_to_letter(next_index)
+                next_index += 1
+                trie[state][char] = new_state
+                trie[new_state] = {}
+            state = trie[state][char]
+        if state != "S" and state not in final_states:
+            final_states.append(state)
+
+    last_state = alphabet.index_to_letter(next_index - 1) if next_index else None
+    return trie, final_states, last_state
+
+
+@instrumented
 def create_afnd(csv_df):
     """
     Cria um AFND (Autômato Finito Não Determinístico) representado como um DataFrame.
 
     Parâmetros:
-    - csv_df (pandas.DataFrame): O DataFrame contendo strings a serem analisadas.
+    - csv_df (pandas.DataFrame | Grammar): O DataFrame contendo strings a serem analisadas.
 
     Retorna:
-    pandas.DataFrame: O DataFrame representando o AFND gerado.
+    tuple: Tupla com o DataFrame representando o AFND gerado e a lista de estados finais.
 
     Nota:
-    - A função cria o esqueleto do AFND utilizando a função 'create_afnd_skeleton'.
-    - Em seguida, preenche o AFND com transições com base nas palavras reservadas e variáveis do DataFrame de entrada.
+    - A gramática é lida uma única vez ('parse_grammar') e reaproveitada pelas etapas seguintes.
+    - As palavras reservadas são inseridas em uma trie ('build_reserved_words_trie').
+    - Em seguida, preenche o AFND com as transições das variáveis do DataFrame de entrada.
+    - As transições são acumuladas em um 'AutomatonBuilder' e o DataFrame é montado uma única vez, no fim.
+    - Alternativas formadas só por uma variável ('<B>') viram transições na coluna 'ε', e as variáveis com a
+      alternativa 'ε' viram estados finais.
     """
+    grammar = parse_grammar(csv_df)
+    trie, final_states, last_state = build_reserved_words_trie(grammar)
+    count(
+        reserved_words=len(grammar.reserved_words),
+        rules=len(grammar.rules),
+        trie_states=len(trie),
+    )
 
-    afnd_df = create_afnd_skeleton(csv_df)
-    reserved_counts = reserved_words_and_counts(csv_df)
-    final_states = []
-    flag = False
-
-    for row in reserved_counts:
-        initial_state = "S"
-
-        word = [c for char in row["word"] for c in char]
-
-        for i, char in enumerate(word):
-            if not final_states:  # Se não for um estado final
-                if not flag:  # Se estiver vazio, não tem estado final até o fim da primeira palavra
-                    afnd_df = insert_value_df(
-                        afnd_df,
-                        "sigma",
-                        initial_state,
-                        char,
-                        alphabet.index_to_letter(i),
-                    )
-                    last_state = alphabet.index_to_letter(i)
-                    flag = True
-                    continue
+    builder = AutomatonBuilder(unique_terminal_letters(grammar))
+    for state, edges in trie.items():
+        builder.add_state(state)
+        for char, target in edges.items():
+            builder.add_edge(state, char, target)
 
-                if flag and last_state == alphabet.index_to_letter(0):
-                    afnd_df = insert_value_df(
-                        afnd_df, "sigma", last_state, char, alphabet.index_to_letter(1)
-                    )
-                    last_state = alphabet.index_to_letter(1)
-
-                elif last_state != alphabet.index_to_letter(0):
-                    afnd_df = insert_value_df(
-                        afnd_df,
-                        "sigma",
-                        last_state,
-                        char,
-                        alphabet.get_next_letter(last_state),
-                    )
-                    last_state = alphabet.get_next_letter(last_state)
-            else:
-                if last_state in (final_states):
-                    if (
-                        not afnd_df.loc[afnd_df["sigma"] == last_state, char]
-                        .isna()
-                        .all()
-                    ):
-                        afnd_df = insert_value_df(
-                            afnd_df,
-                            "sigma",
-                            initial_state,
-                            char,
-                            alphabet.get_next_letter(last_state),
-                        )
-                        last_state = alphabet.get_next_letter(last_state)
-                    continue
-                afnd_df = insert_value_df(
-                    afnd_df,
-                    "sigma",
-                    last_state,
-                    char,
-                    alphabet.get_next_letter(last_state),
-                )
-                last_state = alphabet.get_next_letter(last_state)
+    builder, renamed = replace_variables(builder, grammar, last_state)
 
-        if final_states is not None:
-            final_states.append(last_state)
-    afnd_df, words = replace_variables(afnd_df, csv_df, last_state)
+    # Regras com a alternativa 'ε' tornam finais os estados das suas variáveis
+    for rule in renamed.rules:
+        if rule["nullable"] and rule["symbol"] not in final_states:
+            final_states.append(rule["symbol"])
 
-    afnd_df = populate_variables(afnd_df, words)
-    return afnd_df, final_states
+    builder = populate_variables(builder, renamed)
+    return builder.to_dataframe(), final_states
 
 
 def mark_final_states(dataframe: pd.DataFrame, final_states: list) -> pd.DataFrame:
@@ -464,6 +422,72 @@ def mark_final_states(dataframe: pd.DataFrame, final_states: list) -> pd.DataFra
     return dataframe
 
 
+def afnd_transitions(afnd_df: pd.DataFrame) -> tuple:
+    """Esta função lê as transições de um AFND representado como DataFrame uma única vez.
+
+    Args:
+        afnd_df (pd.DataFrame): DataFrame com o AFND, com células do tipo "A" ou "A,B".
+
+    Returns:
+        tuple: Tupla com a lista de estados (na ordem das linhas), a lista de símbolos e o
+            dicionário de transições no formato {estado: {símbolo: [estados destino]}}.
+    """
+    states = [str(state) for state in afnd_df["sigma"]]
+    symbols = [str(column) for column in afnd_df.columns[1:]]
+    transitions = {}
+
+    for state, row in zip(states, afnd_df[afnd_df.columns[1:]].to_numpy(dtype=object)):
+        transitions[state] = {
+            symbol: [target for target in str(cell).split(",") if target]
+            for symbol, cell in zip(symbols, row)
+            if isinstance(cell, str) and cell != ""
+        }
+    return states, symbols, transitions
+
+
+def state_adjacency(afnd_df: pd.DataFrame) -> tuple:
+    """Esta função monta as listas de adjacência (direta e reversa) do AFND em uma única leitura do DataFrame.
+
+    Args:
+        afnd_df (pd.DataFrame): DataFrame com o AFND.
+
+    Returns:
+        tuple: Tupla com os dicionários {estado: [sucessores]} e {estado: [predecessores]}.
+    """
+    states, _, transitions = afnd_transitions(afnd_df)
+    successors = {state: [] for state in states}
+    predecessors = {state: [] for state in states}
+
+    for state, edges in transitions.items():
+        for targets in edges.values():
+            for target in targets:
+                successors[state].append(target)
+                predecessors.setdefault(target, []).append(state)
+    return successors, predecessors
+
+
+def breadth_first_search(adjacency: dict, start) -> set:
+    """Esta função retorna os estados alcançáveis a partir dos estados iniciais, sem recursão.
+
+    Args:
+        adjacency (dict): Listas de adjacência no formato {estado: [estados vizinhos]}.
+        start (iterable): Estados de onde a busca começa.
+
+    Returns:
+        set: Estados alcançados, incluindo os estados iniciais.
+    """
+    visited_states = set(start)
+    queue = deque(visited_states)
+
+    while queue:
+        for next_state in adjacency.get(queue.popleft(), ()):
+            if next_state not in visited_states:
+                visited_states.add(next_state)
+                queue.append(next_state)
+    return visited_states
+
+
+@instrumented
 def remove_unreachable_states(afnd_df):
     """
     Remove estados inalcançáveis de um AFND (Autômato Finito Não Determinístico).
@@ -476,36 +500,17 @@ def remove_unreachable_states(afnd_df):
 
     Nota:
     - A função remove estados inalcançáveis do AFND, ou seja, estados que não são alcançados a partir do estado inicial.
-    - A função itera sobre as linhas do DataFrame e remove estados inalcançáveis.
-    """
-    visited_states = set()
-
-    def recursive_search(state):
-        for terminal in afnd_df.columns[1:]:
-            if afnd_df.loc[afnd_df["sigma"] == state, terminal].any():
-                states = (
-                    afnd_df.loc[afnd_df["sigma"] == state, terminal]
-                    .str.split(",")
-                    .values[0]
-                )
-                for s in states:
-                    if s != "" and s not in visited_states:
-                        visited_states.add(s)
-                        recursive_search(s)
-        return sorted(visited_states)  # Sort the visited states
-
-    # drop unreachable states
-    reachable_states = recursive_search("S")
-    unreachable_states = [
-        state
-        for state in afnd_df["sigma"]
-        if state not in reachable_states and state != "S"
-    ]
-    afnd_df = afnd_df[~afnd_df["sigma"].isin(unreachable_states)]
+    - Os estados alcançáveis são encontrados com uma busca em largura a partir de 'S' sobre a lista de adjacência.
+    """
+    successors, _ = state_adjacency(afnd_df)
+    reachable_states = breadth_first_search(successors, ["S"])
+
+    afnd_df = afnd_df[afnd_df["sigma"].isin(reachable_states)]
 
     return afnd_df
 
 
+@instrumented
 def remove_dead_states(afnd_df, final_states):
     """
     Remove estados mortos de um AFND (Autômato Finito Não Determinístico).
@@ -519,136 +524,335 @@ def remove_dead_states(afnd_df, final_states):
 
     # Nota:
     - A função remove estados mortos do AFND, ou seja, estados que não podem alcançar um estado final.
-    - A função itera sobre as linhas do DataFrame e remove estados mortos.
+    - Os estados vivos são encontrados com uma única busca em largura reversa a partir dos estados finais.
+    - O estado inicial 'S' nunca é removido.
     """
-    final_states_set = set(final_states)
-
-    def can_reach_final_state(state):
-        visited_states = set()  # Estados visitados
-        stack = [state]  # Pilha de estados a serem visitados
-
-        while stack:
-            current_state = (
-                stack.pop()
-            )  # Remove o último estado da pilha para processamento
-            if current_state in visited_states:
-                continue
-            visited_states.add(current_state)
-            if current_state in final_states_set:
-                return True
-
-            for terminal in afnd_df.columns[1:]:
-                # Obtém os próximos estados possíveis a partir do estado atual e da entrada do terminal atual
-                next_states = (
-                    afnd_df.loc[afnd_df["sigma"] == current_state, terminal]
-                    .str.split(",")
-                    .values
-                )
-
-                if next_states.size > 0:
-                    for next_state in next_states[0]:
-                        if next_state and next_state not in visited_states:
-                            stack.append(next_state)
-
-        return False
-
-    # Encontra todos os estados mortos
-    dead_states = set()
-    for state in afnd_df["sigma"]:
-        if not can_reach_final_state(state):
-            dead_states.add(state)
-
-    for state in dead_states:  # Remove todas as transições dos estados mortos
-        for column in afnd_df.columns[1:]:
-            afnd_df[column] = afnd_df[column].apply(
-                lambda x: ",".join([
-                    elem for elem in str(x).split(",") if elem.strip() != state
-                ])
-            )
-
-    # Remove os estados mortos do AFND
-    afnd_df = afnd_df[~afnd_df["sigma"].isin(dead_states)]
+    _, predecessors = state_adjacency(afnd_df)
+    live_states = breadth_first_search(predecessors, final_states) | {"S"}
+
+    dead_states = set(afnd_df["sigma"]) - live_states
+    if not dead_states:
+        return afnd_df
+
+    # Remove todas as transições para estados mortos, calculando cada célula distinta uma única vez
+    afnd_df = afnd_df[~afnd_df["sigma"].isin(dead_states)].copy()
+    columns = afnd_df.columns[1:]
+    cleaned_cells = {
+        cell: ",".join(
+            state for state in str(cell).split(",") if state.strip() not in dead_states
+        )
+        for cell in pd.unique(afnd_df[columns].to_numpy().ravel())
+        if isinstance(cell, str)
+    }
+    for column in columns:
+        afnd_df[column] = afnd_df[column].map(
+            lambda cell: cleaned_cells.get(cell, cell)
+        )
 
     return afnd_df
 
 
+def to_bitset(states, state_index: dict) -> int:
+    """Esta função converte um conjunto de estados em um bitset (inteiro do Python).
+
+    Args:
+        states (iterable): Estados do conjunto.
+        state_index (dict): Id de cada estado; o estado de id i corresponde ao bit i.
+
+    Returns:
+        int: Bitset do conjunto. União é '|', interseção é '&' e o próprio inteiro serve de chave de dicionário.
+    """
+    bitset = 0
+    for state in states:
+        bitset |= 1 << state_index[state]
+    return bitset
+
+
+def iter_bitset(bitset: int):
+    """Esta função gera os ids dos estados de um bitset, em ordem crescente.
+
+    Args:
+        bitset (int): Bitset de estados.
+
+    Yields:
+        int: Id de cada estado presente no bitset.
+    """
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+def subset_name(subset: int, states: list) -> str:
+    """Esta função gera o nome de um estado do AFD a partir do conjunto de estados do AFND.
+
+    Args:
+        subset (int): Bitset dos estados do AFND.
+        states (list): Estados do AFND, na ordem dos ids; também define a ordem dos nomes.
+
+    Returns:
+        str: O próprio estado para conjuntos unitários, ou os estados entre colchetes (ex.: "[AH]"
+            ou, com algum estado de várias letras, "[A.BC]"). Ver 'Alphabet.subset_name'.
+    """
+    return alphabet.subset_name([states[i] for i in iter_bitset(subset)])
+
+
+def epsilon_closures(epsilon_targets: list) -> list:
+    """Esta função calcula o fecho-ε de cada estado do AFND, uma única vez por estado.
+
+    Args:
+        epsilon_targets (list): Bitset dos destinos das transições ε de cada estado.
+
+    Returns:
+        list: Bitset do fecho-ε de cada estado (o próprio estado e todos os alcançáveis só por transições ε).
+    """
+    closures = []
+    for i in range(len(epsilon_targets)):
+        closure = 1 << i
+        frontier = closure
+        while frontier:
+            reached = 0
+            for j in iter_bitset(frontier):
+                reached |= epsilon_targets[j]
+            frontier = reached & ~closure
+            closure |= frontier
+        closures.append(closure)
+    return closures
+
+
+def epsilon_finals(closures: list, final_bitset: int) -> int:
+    """Esta função retorna o bitset dos estados cujo fecho-ε contém algum estado final.
+
+    Args:
+        closures (list): Bitset do fecho-ε de cada estado ('epsilon_closures').
+        final_bitset (int): Bitset dos estados finais.
+
+    Returns:
+        int: Bitset dos estados que aceitam; um conjunto fechado por ε é final se tiver algum deles.
+    """
+    finals = 0
+    for i, closure in enumerate(closures):
+        if closure & final_bitset:
+            finals |= 1 << i
+    return finals
+
+
+def nfa_bitsets(states: list, symbols: list, transitions: dict) -> tuple:
+    """Esta função calcula, para cada estado do AFND, o bitset dos destinos de cada símbolo.
+
+    Args:
+        states (list): Estados do AFND.
+        symbols (list): Símbolos do alfabeto, podendo incluir a coluna 'ε'.
+        transitions (dict): Transições do AFND no formato {estado: {símbolo: [estados destino]}}.
+
+    Returns:
+        tuple: Tupla com a lista de estados do AFND (ids dos bits, incluindo destinos que não são linhas),
+            a lista de símbolos sem o 'ε', a lista, por estado, com o bitset dos destinos de cada símbolo,
+            na ordem desses símbolos, e o bitset do fecho-ε de cada estado.
+
+    Nota:
+    - Os fechos-ε são calculados uma única vez e embutidos nos destinos: o destino de um estado por um
+      símbolo já parte do fecho-ε do estado e já inclui o fecho-ε de cada estado alcançado. Assim, a
+      construção de subconjuntos não precisa tratar transições ε.
+    - Sem a coluna 'ε', cada fecho é o próprio estado e os destinos não mudam.
+    """
+    states = list(
+        od.fromkeys(
+            list(states)
+            + [
+                target
+                for edges in transitions.values()
+                for targets in edges.values()
+                for target in targets
+            ]
+        )
+    )
+    state_index = {state: i for i, state in enumerate(states)}
+
+    targets_by_state = [
+        [
+            to_bitset(transitions.get(state, {}).get(symbol, ()), state_index)
+            for symbol in symbols
+        ]
+        for state in states
+    ]
+    if Grammar.epsilon not in symbols:
+        closures = [1 << i for i in range(len(states))]
+        return states, list(symbols), targets_by_state, closures
+
+    epsilon = symbols.index(Grammar.epsilon)
+    closures = epsilon_closures([targets[epsilon] for targets in targets_by_state])
+    columns = [j for j, symbol in enumerate(symbols) if j != epsilon]
+    symbols = [symbols[j] for j in columns]
+
+    def closure_of(bitset: int) -> int:
+        closure = 0
+        for i in iter_bitset(bitset):
+            closure |= closures[i]
+        return closure
+
+    folded = []
+    for i in range(len(states)):
+        sources = list(iter_bitset(closures[i]))
+        row = []
+        for j in columns:
+            moved = 0
+            for source in sources:
+                moved |= targets_by_state[source][j]
+            row.append(closure_of(moved))
+        folded.append(row)
+    targets_by_state = folded
+    return states, symbols, targets_by_state, closures
+
+
+def subset_construction(states: list, symbols: list, transitions: dict) -> tuple:
+    """Esta função determiniza um AFND pela construção de subconjuntos, usando uma lista de trabalho.
+
+    Args:
+        states (list): Estados do AFND; cada um vira um estado unitário do AFD, na mesma ordem.
+        symbols (list): Símbolos do alfabeto.
+        transitions (dict): Transições do AFND no formato {estado: {símbolo: [estados destino]}}.
+
+    Returns:
+        tuple: Tupla com a lista de estados do AFND (ids dos bits, incluindo destinos que não são linhas),
+            a lista de bitsets de cada estado do AFD, na ordem em que foram criados, as transições do AFD
+            no formato {id do estado: {símbolo: id do estado destino}}, sem o 'ε', e o bitset do fecho-ε
+            de cada estado do AFND.
+
+    Nota:
+    - Os conjuntos de estados são bitsets (inteiros do Python), então a união é um '|' e o próprio
+      conjunto é a chave do dicionário conjunto -> id.
+    - Cada conjunto é registrado uma única vez, então indeterminismos criados por outros indeterminismos
+      também são tratados.
+    - As transições ε já vêm embutidas nos destinos ('nfa_bitsets'); os estados unitários mantêm o nome
+      do estado do AFND, mas se comportam como o fecho-ε dele.
+    """
+    states, symbols, targets_by_state, closures = nfa_bitsets(
+        states, symbols, transitions
+    )
+
+    subsets = [1 << i for i in range(len(states))]
+    subset_ids = {subset: i for i, subset in enumerate(subsets)}
+
+    dfa_transitions = {}
+    worklist = 0
+    while worklist < len(subsets):  # Os novos conjuntos entram no fim da lista
+        subset = subsets[worklist]
+        state_ids = list(iter_bitset(subset))
+        row = {}
+        for j, symbol in enumerate(symbols):
+            targets = 0
+            for i in state_ids:
+                targets |= targets_by_state[i][j]
+            if targets:
+                if targets not in subset_ids:
+                    subset_ids[targets] = len(subsets)
+                    subsets.append(targets)
+                row[symbol] = subset_ids[targets]
+        dfa_transitions[worklist] = row
+        worklist += 1
+
+    return states, subsets, dfa_transitions, closures
+
+
+@instrumented
 def determinize_afnd(csv_df, afnd_df, final_states):
     """
-    Preenche uma linha do AFND (Autômato Finito Determinístico) com o símbolo de indeterminismo. Juntamente com os estados de cada transição.
+    Determiniza o AFND pela construção de subconjuntos. Cada indeterminismo vira um novo estado com o nome
+    dos estados que o compõem entre colchetes (ex.: "A,H" -> "[AH]").
 
     Parâmetros:
     - csv_df (pandas.DataFrame): O DataFrame contendo strings a serem analisadas.
     - afnd_df (pandas.DataFrame): O DataFrame representando o AFND gerado.
-    - indeterminism_symbol (str): O símbolo de indeterminismo a ser utilizado.
+    - final_states (list): Lista de estados finais do AFND.
 
     Retorna:
-    pandas.DataFrame: O DataFrame do AFD atualizado com o símbolo de indeterminismo.
+    tuple: Tupla com o DataFrame do AFD e a lista de estados finais, incluindo os novos estados que contêm
+        algum estado final.
+
+    Nota:
+    - Os estados do AFND são mantidos na mesma ordem e os novos estados são adicionados ao fim.
+    - O DataFrame é montado uma única vez, ao final da construção.
+    - Transições ε (coluna 'ε') são resolvidas com os fechos-ε de cada estado; um estado cujo fecho-ε
+      contém um estado final também é final, e a coluna 'ε' não aparece no AFD.
     """
-    indeterminisms = [
-        (afnd_df.loc[afnd_df[terminal].str.len() > 1, terminal]).tolist()
-        for terminal in afnd_df.columns[1:]
-        # Lista de listas contendo os indeterminismos iniciais do AFND
-        if not afnd_df.loc[afnd_df[terminal].str.len() > 1, terminal].empty
+    states, symbols, transitions = afnd_transitions(afnd_df)
+    states, subsets, dfa_transitions, closures = subset_construction(
+        states, symbols, transitions
+    )
+    symbols = [symbol for symbol in symbols if symbol != Grammar.epsilon]
+    count(
+        nfa_states=len(states),
+        dfa_states=len(subsets),
+        indeterminisms=sum(subset.bit_count() > 1 for subset in subsets),
+    )
+
+    names = [subset_name(subset, states) for subset in subsets]
+
+    builder = AutomatonBuilder(symbols)
+    for i, name in enumerate(names):
+        builder.add_state(name)
+        for symbol, target in dfa_transitions[i].items():
+            builder.add_edge(name, symbol, names[target])
+    afd_df = builder.to_dataframe()
+
+    state_index = {state: i for i, state in enumerate(states)}
+    final_bitset = epsilon_finals(
+        closures,
+        to_bitset(
+            (state for state in final_states if state in state_index), state_index
+        ),
+    )
+    final_states = list(final_states) + [
+        name
+        for subset, name in zip(subsets, names)
+        if subset & final_bitset and name not in final_states
     ]
 
-    all_indeterminisms = indeterminisms.copy()
-
-    columns = unique_terminal_letters(csv_df)
-
-    while indeterminisms:
-        for indeterminism in enumerate(indeterminisms):
-            # Converte a lista de apenas um elemento para uma string [A,B] -> "A,B"
-            [indeterminism_symbol] = indeterminisms[0]
-            last_index = afnd_df["sigma"].index[-1]
-            afnd_df.at[last_index + 1, "sigma"] = indeterminism_symbol
-
-            # Percorre os estados do indeterminismo
-            for state in afnd_df["sigma"].iloc[-1].split(","):
-                for column in columns:  # Percorre as colunas do AFND
-                    afnd_df = insert_value_df(
-                        afnd_df,
-                        "sigma",
-                        indeterminism_symbol,
-                        column,
-                        afnd_df.loc[afnd_df["sigma"] == state, column].iloc[0],
-                    )
-            indeterminisms.pop(0)
-
-            # Seleciona a última linha do AFND
-            last_row_df = afnd_df.iloc[-1].to_frame().T
-            new_indeterminisms = [
-                (
-                    last_row_df.loc[last_row_df[terminal].str.len() > 1, terminal]
-                ).tolist()
-                for terminal in last_row_df.columns[1:]
-                # Seleciona os indeterminismos da última linha do AFND
-                if not last_row_df.loc[
-                    last_row_df[terminal].str.len() > 1, terminal
-                ].empty
-            ]
+    return afd_df, final_states
 
-            # Adiciona os novos indeterminismos à lista de indeterminismos
-            indeterminisms.extend(new_indeterminisms)
-            # Lista de listas contendo todos os indeterminismos do AFD
-            all_indeterminisms.extend(new_indeterminisms)
 
-    for indeterminism in all_indeterminisms:
-        value = indeterminism[0]
-        indeterminism_without_comma = value.replace(",", "")
+def lazy_automaton(
+    afnd_df: pd.DataFrame, final_states: list, max_states: int = 4096
+) -> LazyAutomaton:
+    """Esta função cria um AFD sob demanda a partir do AFND, sem determinizá-lo por completo.
 
-        for col in afnd_df.columns:
-            # Use the apply method to apply the transformation to each cell
-            afnd_df[col] = afnd_df[col].apply(
-                lambda x: f"[{indeterminism_without_comma}]" if x == value else x
-            )
+    Args:
+        afnd_df (pd.DataFrame): DataFrame com o AFND (ex.: saída de 'remove_dead_states').
+        final_states (list): Lista de estados finais.
+        max_states (int): Quantidade máxima de estados do AFD mantidos em cache (ver 'LazyAutomaton').
 
-    for state in afnd_df["sigma"]:
-        if any(x in state for x in final_states) and state not in final_states:
-            final_states.append(state)
+    Returns:
+        LazyAutomaton: Autômato que reconhece as mesmas palavras, com os mesmos nomes de estados, que o AFD
+            de 'determinize_afnd' seguido de 'error_states'.
 
-    return afnd_df, final_states
+    Nota:
+    - Útil para gramáticas cuja determinização completa gera estados demais: a memória fica limitada pelo
+      cache, e só os estados que as entradas realmente visitam são calculados.
+    - 'stats' informa a taxa de acerto do cache.
+    """
+    states, symbols, transitions = afnd_transitions(afnd_df)
+    states, symbols, targets_by_state, closures = nfa_bitsets(
+        states, symbols, transitions
+    )
+    state_index = {state: i for i, state in enumerate(states)}
+    final = epsilon_finals(
+        closures,
+        to_bitset(
+            (state for state in final_states if state in state_index), state_index
+        ),
+    )
+    return LazyAutomaton(
+        states,
+        symbols,
+        targets_by_state,
+        final,
+        state_index.get("S", 0),
+        max_states,
+    )
 
 
+@instrumented
 def error_states(afd_df: pd.DataFrame, final_states: list) -> tuple:
     """Esta função adiciona estados de erro ao AFD (Autômato Finito Determinístico) para garantir que todos os estados tenham transições para todos os símbolos do alfabeto.
 
@@ -666,10 +870,10 @@ def error_states(afd_df: pd.DataFrame, final_states: list) -> tuple:
         new_state_error_transition
     ] * (len(afd_df.columns) - 1)
 
-    for column in afd_df.columns:
-        for index, value in afd_df[column].items():
-            if value == "" or value is None:
-                afd_df.at[index, column] = new_state_error_transition
+    # Preenche todas as células vazias de uma vez, em vez de célula a célula
+    afd_df = afd_df.fillna(new_state_error_transition).replace(
+        "", new_state_error_transition
+    )
 
     # Controle de erro para estados que não possuem o mapeamento de todos os simbolos da gramática
     new_state_error = "Z"
@@ -688,6 +892,136 @@ def error_states(afd_df: pd.DataFrame, final_states: list) -> tuple:
     return afd_df, final_states
 
 
+@instrumented
+def minimize_afd(
+    afd_df: pd.DataFrame, final_states: list, partition_finals: bool = True
+) -> tuple:
+    """Esta função minimiza o AFD com o algoritmo de refinamento de partições de Hopcroft (O(n log n)).
+
+    Args:
+        afd_df (pd.DataFrame): DataFrame com o AFD, normalmente já com os estados de erro ('&' e 'Z').
+        final_states (list): Lista de estados finais.
+        partition_finals (bool): Se True, cada estado final começa em um bloco próprio, preservando
+            o estado final de cada palavra na fita. Se False, usa a partição clássica finais/não finais.
+            Em ambos os casos, os estados de erro ('&' e 'Z') ficam em blocos próprios.
+
+    Returns:
+        tuple: Tupla com o DataFrame do AFD mínimo, a lista de estados finais e o dicionário que mapeia
+            cada estado alcançável do AFD original para o estado equivalente no AFD mínimo.
+
+    Nota:
+    - Estados inalcançáveis a partir de 'S' são descartados antes da minimização.
+    - Cada bloco de estados equivalentes recebe o nome do seu primeiro estado na ordem das linhas.
+    - Células vazias são tratadas como transições para um estado morto implícito, que continua vazio no
+      AFD mínimo, a menos que seja equivalente a algum estado existente.
+    """
+    states, symbols, transitions = afnd_transitions(afd_df)
+    state_index = {state: i for i, state in enumerate(states)}
+
+    # Estados alcançáveis a partir do estado inicial, na ordem das linhas
+    initial = state_index.get("S", 0)
+    reachable = {initial}
+    stack = [initial]
+    while stack:
+        state = states[stack.pop()]
+        for targets in transitions[state].values():
+            for target in targets:
+                target_id = state_index[target]
+                if target_id not in reachable:
+                    reachable.add(target_id)
+                    stack.append(target_id)
+    kept = [state for i, state in enumerate(states) if i in reachable]
+    kept_index = {state: i for i, state in enumerate(kept)}
+
+    # O último id é o estado morto implícito das células vazias
+    sink = len(kept)
+    delta = [
+        [
+            kept_index[transitions[state][symbol][0]]
+            if symbol in transitions[state]
+            else sink
+            for symbol in symbols
+        ]
+        for state in kept
+    ] + [[sink] * len(symbols)]
+
+    inverse = [[[] for _ in range(sink + 1)] for _ in symbols]
+    for source, row in enumerate(delta):
+        for symbol, target in enumerate(row):
+            inverse[symbol][target].append(source)
+
+    # Partição inicial. Os estados de erro de 'error_states' também estão em 'final_states', mas
+    # nunca podem ser juntados aos estados finais de verdade
+    error_names = ("&", "Z")
+    final_states_set = set(final_states)
+    errors = [i for i, state in enumerate(kept) if state in error_names]
+    non_final = [
+        i
+        for i, state in enumerate(kept)
+        if state not in final_states_set and state not in error_names
+    ]
+    finals = [
+        i
+        for i, state in enumerate(kept)
+        if state in final_states_set and state not in error_names
+    ]
+    if partition_finals:
+        blocks = [set(non_final + [sink])] + [{i} for i in finals + errors]
+    else:
+        blocks = [set(non_final + [sink]), set(finals)] + [{i} for i in errors]
+    blocks = [block for block in blocks if block]
+    block_of = [0] * (sink + 1)
+    for block_id, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = block_id
+
+    worklist = set(range(len(blocks)))
+    while worklist:
+        splitter = list(blocks[worklist.pop()])
+        for symbol in range(len(symbols)):
+            predecessors = {
+                source for target in splitter for source in inverse[symbol][target]
+            }
+            touched = {}
+            for state in predecessors:
+                touched.setdefault(block_of[state], []).append(state)
+
+            for block_id, inside in touched.items():
+                if len(inside) == len(blocks[block_id]):
+                    continue
+                new_id = len(blocks)
+                blocks[block_id].difference_update(inside)
+                blocks.append(set(inside))
+                for state in inside:
+                    block_of[state] = new_id
+                if block_id in worklist or len(inside) <= len(blocks[block_id]):
+                    worklist.add(new_id)
+                else:
+                    worklist.add(block_id)
+
+    # Nome de cada bloco: o primeiro estado do bloco na ordem das linhas
+    block_names = {}
+    for i, state in enumerate(kept):
+        block_names.setdefault(block_of[i], state)
+
+    mapping = {state: block_names[block_of[i]] for i, state in enumerate(kept)}
+    representatives = list(od.fromkeys(mapping.values()))
+
+    rows = []
+    for name in representatives:
+        source = kept_index[name]
+        rows.append(
+            [name] + [block_names.get(block_of[target], "") for target in delta[source]]
+        )
+    min_df = pd.DataFrame(rows, columns=afd_df.columns)
+
+    new_final_states = list(
+        od.fromkeys(mapping[state] for state in final_states if state in mapping)
+    )
+
+    return min_df, new_final_states, mapping
+
+
 def read_new_words(csv_df: pd.DataFrame) -> dict:
     """Esta função lê um arquivo csv e retorna um dicionário com as palavras e seus respectivos índices.
 
@@ -711,72 +1045,545 @@ def read_new_words(csv_df: pd.DataFrame) -> dict:
     return words
 
 
-def recursive_search(dataframe: pd.DataFrame, word: list) -> list:
+def compile_afd(afd_df: pd.DataFrame, final_states: list = ()) -> CompiledAutomaton:
+    """Esta função compila o AFD em uma tabela de transição de inteiros (estados x classes de símbolo).
+
+    Args:
+        afd_df (pd.DataFrame): DataFrame com o AFD, normalmente já com os estados de erro.
+        final_states (list): Lista de estados finais.
+
+    Returns:
+        CompiledAutomaton: Autômato compilado, que reconhece cada caractere em O(1).
+    """
+    return CompiledAutomaton.from_dataframe(afd_df, final_states)
+
+
+def grammar_hash(csv_df: pd.DataFrame) -> str:
+    """Esta função calcula o hash (sha256) da gramática lida com 'parse_grammar'.
+
+    Args:
+        csv_df (pd.DataFrame | Grammar): DataFrame com a gramática (ex.: 'entrada.csv') ou a 'Grammar' já lida.
+
+    Returns:
+        str: Hash em hexadecimal das palavras reservadas, dos terminais e das alternativas de cada regra, na
+            ordem em que foram lidos. Só muda o hash o que muda a leitura: espaços entre as alternativas não
+            contam, mas '<S>  ::= a<A>' (dois espaços) é uma palavra reservada e tem outro hash.
+    """
+    grammar = parse_grammar(csv_df)
+    text = json.dumps(
+        [
+            grammar.reserved_words,
+            grammar.terminals,
+            [[rule["symbol"], rule["productions"]] for rule in grammar.rules],
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Versão da construção do AFD. Aumente sempre que uma mudança nas etapas (nomes dos estados, transições ε,
+# minimização, ...) alterar o autômato gerado para a mesma gramática, para invalidar os caches em disco.
+BUILD_VERSION = 1
+
+
+def automaton_key(csv_df: pd.DataFrame) -> str:
+    """Esta função calcula a chave do AFD construído a partir da gramática.
+
+    Args:
+        csv_df (pd.DataFrame | Grammar): DataFrame com a gramática (ex.: 'entrada.csv') ou a 'Grammar' já lida.
+
+    Returns:
+        str: Hash (sha256) em hexadecimal de 'grammar_hash' junto com 'BUILD_VERSION'. É a chave dos caches
+            ('compile_grammar', 'compile_recognizer') e o hash gravado nos arquivos salvos, então um AFD gerado
+            por outra versão da construção não é reaproveitado.
+    """
+    text = f"{BUILD_VERSION}:{grammar_hash(csv_df)}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def save_automaton(
+    afd, path, final_states: list = (), csv_df: pd.DataFrame = None
+) -> CompiledAutomaton:
+    """Esta função salva o AFD compilado em um arquivo binário que pode ser mapeado em memória.
+
+    Args:
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+        path (str | os.PathLike): Caminho do arquivo.
+        final_states (list): Lista de estados finais, usada quando o AFD é um DataFrame.
+        csv_df (pd.DataFrame): Gramática que gerou o AFD; a chave dela ('automaton_key') é gravada no arquivo.
+
+    Returns:
+        CompiledAutomaton: O autômato salvo.
+    """
+    automaton = (
+        afd if isinstance(afd, CompiledAutomaton) else compile_afd(afd, final_states)
+    )
+    if csv_df is not None:
+        automaton.source_hash = automaton_key(csv_df)
+    automaton.save(path)
+    return automaton
+
+
+def load_automaton(
+    path, csv_df: pd.DataFrame = None, mmap: bool = True
+) -> CompiledAutomaton:
+    """Esta função carrega um AFD compilado salvo com 'save_automaton'.
+
+    Args:
+        path (str | os.PathLike): Caminho do arquivo.
+        csv_df (pd.DataFrame): Gramática atual; se informada, o arquivo precisa ter sido gerado a partir dela.
+        mmap (bool): Se True, a tabela é mapeada em memória e compartilhada entre processos.
+
+    Returns:
+        CompiledAutomaton: O autômato carregado.
+
+    Raises:
+        ValueError: Se o arquivo for inválido ou tiver sido gerado a partir de outra gramática ou por outra
+            versão da construção ('BUILD_VERSION').
+    """
+    automaton = CompiledAutomaton.load(path, mmap=mmap)
+    if csv_df is not None and automaton.source_hash != automaton_key(csv_df):
+        raise ValueError(
+            f"O autômato em {path} está desatualizado em relação à gramática"
+        )
+    return automaton
+
+
+def save_recognizer(
+    afd, path, final_states: list = (), csv_df: pd.DataFrame = None
+) -> str:
+    """Esta função gera e salva o módulo Python especializado que reconhece palavras no AFD.
+
+    Args:
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+        path (str | os.PathLike): Caminho do arquivo '.py'.
+        final_states (list): Lista de estados finais, usada quando o AFD é um DataFrame.
+        csv_df (pd.DataFrame): Gramática que gerou o AFD; a chave dela ('automaton_key') é gravada no módulo.
+
+    Returns:
+        str: Código-fonte do módulo salvo.
+
+    Nota:
+    - O arquivo é escrito em um temporário e renomeado, então outro processo nunca importa um módulo pela metade.
+    - Ver 'CompiledAutomaton.to_source' para o conteúdo do módulo.
+    """
+    automaton = (
+        afd if isinstance(afd, CompiledAutomaton) else compile_afd(afd, final_states)
+    )
+    if csv_df is not None:
+        automaton.source_hash = automaton_key(csv_df)
+    source = automaton.to_source()
+
+    temporary_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        file.write(source)
+    os.replace(temporary_path, path)
+    return source
+
+
+def load_recognizer(path, csv_df: pd.DataFrame = None):
+    """Esta função importa um módulo salvo com 'save_recognizer'.
+
+    Args:
+        path (str | os.PathLike): Caminho do arquivo '.py'.
+        csv_df (pd.DataFrame): Gramática atual; se informada, o módulo precisa ter sido gerado a partir dela.
+
+    Returns:
+        module: Módulo com 'run', 'recognize', 'accepts' e 'STATES'.
+
+    Raises:
+        ValueError: Se o módulo tiver sido gerado a partir de outra gramática ou por outra versão da construção.
+    """
+    path = os.fspath(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if csv_df is not None and module.SOURCE_HASH != automaton_key(csv_df):
+        raise ValueError(
+            f"O reconhecedor em {path} está desatualizado em relação à gramática"
+        )
+    return module
+
+
+def compile_recognizer(csv_df: pd.DataFrame, directory):
+    """Esta função retorna o módulo reconhecedor da gramática, gerando-o apenas se ainda não estiver no diretório.
+
+    Args:
+        csv_df (pd.DataFrame): DataFrame com a gramática (ex.: 'entrada.csv').
+        directory (str | os.PathLike): Diretório dos módulos gerados, um 'afd_<hash>.py' por gramática.
+
+    Returns:
+        module: Módulo gerado por 'save_recognizer'.
+
+    Nota:
+    - Depois de gerado, o módulo pode ser importado diretamente, sem pandas e sem reconstruir o AFD.
+    """
+    key = automaton_key(csv_df)
+    path = os.path.join(directory, f"afd_{key}.py")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        save_recognizer(build_automaton(csv_df), path)
+    return load_recognizer(path)
+
+
+@instrumented
+def build_automaton(csv_df: pd.DataFrame) -> CompiledAutomaton:
+    """Esta função executa toda a construção do AFD a partir da gramática e o compila.
+
+    Args:
+        csv_df (pd.DataFrame): DataFrame com a gramática (ex.: 'entrada.csv').
+
+    Returns:
+        CompiledAutomaton: AFD mínimo compilado, com o hash da gramática.
+
+    Nota:
+    - As etapas são as mesmas do notebook: 'create_afnd', 'remove_unreachable_states', 'remove_dead_states',
+      'determinize_afnd', 'error_states' e 'minimize_afd'.
+    """
+    afnd_df, final_states = create_afnd(csv_df)
+    afnd_df = remove_unreachable_states(afnd_df)
+    afnd_df = remove_dead_states(afnd_df, final_states)
+    afd_df, final_states = determinize_afnd(csv_df, afnd_df, final_states)
+    afd_df, final_states = error_states(afd_df, final_states)
+    afd_df, final_states, _ = minimize_afd(afd_df, final_states)
+
+    automaton = compile_afd(afd_df, final_states)
+    automaton.source_hash = automaton_key(csv_df)
+    return automaton
+
+
+def compile_grammar(
+    csv_df: pd.DataFrame, cache: AutomatonCache = automaton_cache
+) -> CompiledAutomaton:
+    """Esta função retorna o AFD compilado da gramática, reaproveitando o cache quando a gramática não mudou.
+
+    Args:
+        csv_df (pd.DataFrame): DataFrame com a gramática (ex.: 'entrada.csv').
+        cache (AutomatonCache): Cache a ser usado. Por padrão, o cache em memória do processo; use
+            'AutomatonCache(diretorio)' para compartilhar os autômatos entre processos e execuções.
+
+    Returns:
+        CompiledAutomaton: AFD mínimo compilado.
+    """
+    if cache is None:
+        return build_automaton(csv_df)
+    return cache.get_or_build(automaton_key(csv_df), lambda: build_automaton(csv_df))
+
+
+def recursive_search(dataframe, word: str) -> list:
     """
-    Recursively searches for paths in a transition table DataFrame that match the given list of terminals.
+    Percorre o AFD consumindo a palavra e retorna os estados visitados.
 
     Parameters:
-    dataframe (pd.DataFrame): DataFrame representing the transition table.
-    word (list): List of terminals to match.
+    dataframe (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+    word (str): Palavra a ser reconhecida.
 
     Returns:
-    list: List of visited states.
+    list: Lista de estados visitados, um por caractere consumido; o último é o estado em que a palavra termina.
+
+    Nota:
+    - Passar um DataFrame compila a tabela a cada chamada; para várias palavras, compile uma vez e reutilize.
     """
-    visited_states = []
+    automaton = (
+        dataframe
+        if isinstance(dataframe, CompiledAutomaton)
+        else compile_afd(dataframe)
+    )
+    return automaton.trace(word)
 
-    def search_from_state(state: str, word: list = word):
-        """
-        Recursively searches for paths from a given state.
 
-        Parameters:
-        state (str): The current state.
+_worker_automaton = None
 
-        Returns:
-        list: List of visited states.
-        """
-        for terminal in word:
-            # print(terminal)
-            if terminal in dataframe.columns:
-                if dataframe.loc[dataframe["sigma"] == state, terminal].any():
-                    state = dataframe.loc[dataframe["sigma"] == state, terminal].values[
-                        0
-                    ]
 
-                    if state not in visited_states:
-                        visited_states.append(state)
-                        search_from_state(state, word[1:])
-            else:
-                if dataframe.loc[dataframe["sigma"] == state, "etc."].any():
-                    state = dataframe.loc[dataframe["sigma"] == state, "etc."].values[0]
+def _load_worker_automaton(path) -> None:
+    """Carrega, uma vez por processo, o autômato compartilhado (mapeado em memória)."""
+    global _worker_automaton
+    _worker_automaton = CompiledAutomaton.load(path, mmap=True)
+
+
+def _trace_shard(words: list) -> list:
+    return [_worker_automaton.trace(word) for word in words]
+
 
-                    if state not in visited_states:
-                        visited_states.append(state)
-                        return visited_states
-        return visited_states
+def parallel_trace(
+    words: list,
+    automaton: CompiledAutomaton,
+    workers: int = None,
+    shard_size: int = 10000,
+) -> list:
+    """Esta função percorre o AFD para cada palavra usando vários processos.
 
-    # check type of teste
-    return search_from_state("S")
+    Args:
+        words (list): Palavras a serem reconhecidas.
+        automaton (CompiledAutomaton): AFD compilado.
+        workers (int): Quantidade de processos. Se None, usa a quantidade de CPUs.
+        shard_size (int): Quantidade de palavras enviadas a um processo por vez.
+
+    Returns:
+        list: Lista com os estados visitados de cada palavra, na mesma ordem das palavras.
+
+    Nota:
+    - O autômato é salvo em um arquivo temporário e cada processo o mapeia em memória com 'numpy.memmap',
+      então a tabela é compartilhada (somente leitura) em vez de copiada para cada processo: o 'trace' dos
+      processos lê as páginas mapeadas diretamente, sem criar a versão em lista da tabela.
+    """
+    shards = [words[i : i + shard_size] for i in range(0, len(words), shard_size)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "automaton.afd")
+        automaton.save(path)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_load_worker_automaton,
+            initargs=(path,),
+        ) as executor:
+            # 'map' devolve os resultados na ordem das partes, preservando a ordem das palavras
+            return [
+                states
+                for shard in executor.map(_trace_shard, shards)
+                for states in shard
+            ]
 
 
-def af_mapping(csv_df: pd.DataFrame, afd_df: pd.DataFrame) -> tuple:
+def af_mapping(csv_df: pd.DataFrame, afd_df: pd.DataFrame, workers: int = 1) -> tuple:
     """Essa função mapeia novas palavras em um AFD. Verificando se a palavra é aceita ou não pelo autômato.
 
     Args:
         csv_df (pd.DataFrame): DataFrame com as palavras a serem mapeadas.
-        afd_df (pd.DataFrame): DataFrame com o AFD.
+        afd_df (pd.DataFrame | CompiledAutomaton): DataFrame com o AFD, ou o AFD já compilado.
+        workers (int): Quantidade de processos usados no reconhecimento. Com 1 (padrão), tudo roda no
+            processo atual; com None, usa a quantidade de CPUs (ver 'parallel_trace').
 
     Returns:
         tuple: Tupla com as palavras mapeadas e a fita.
     """
+    automaton = afd_df if isinstance(afd_df, CompiledAutomaton) else compile_afd(afd_df)
     words = read_new_words(csv_df)
-    for index, word in enumerate(words):
-        states = recursive_search(afd_df, word["word"])
-        words[index].update({"states": states})
+    if workers == 1:
+        for index, word in enumerate(words):
+            states = recursive_search(automaton, word["word"])
+            words[index].update({"states": states})
+    else:
+        all_states = parallel_trace(
+            [word["word"] for word in words], automaton, workers
+        )
+        for word, states in zip(words, all_states):
+            word.update({"states": states})
     ribbon = [word["states"][-1] for word in words] + ["$"]
 
     return words, ribbon
 
 
+def encode_batch(words: list) -> tuple:
+    """Esta função junta as palavras em um único buffer de bytes, com o vetor de posições de cada palavra.
+
+    Args:
+        words (list): Palavras (str ou bytes).
+
+    Returns:
+        tuple: Tupla com o buffer ('np.uint8') e o vetor 'np.int64' com 'len(words) + 1' posições, no formato
+            de 'CompiledAutomaton.run_batch'.
+    """
+    encoded = [
+        word if isinstance(word, bytes) else word.encode("utf-8") for word in words
+    ]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(word) for word in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def recognize_batch(words: list, afd, jit: bool = None) -> list:
+    """Esta função reconhece um lote de palavras de uma vez, retornando o estado final de cada uma.
+
+    Args:
+        words (list): Palavras a serem reconhecidas.
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+        jit (bool): Backend do laço (ver 'CompiledAutomaton.run_batch'); por padrão, o Numba se estiver instalado.
+
+    Returns:
+        list: Nome do estado final de cada palavra (None se faltou transição), como o último estado de cada
+            palavra no 'af_mapping'; a fita é essa lista seguida de '$'.
+
+    Nota:
+    - O reconhecimento é feito sobre os bytes UTF-8 das palavras; caracteres fora do ASCII caem na coluna 'etc.'.
+    - Se o alfabeto tiver símbolos fora do ASCII (ex.: 'então'), cada palavra é reconhecida como texto com
+      'CompiledAutomaton.recognize', já que esses símbolos não cabem em um byte.
+    """
+    automaton = afd if isinstance(afd, CompiledAutomaton) else compile_afd(afd)
+    if not automaton.ascii:
+        return [
+            automaton.recognize(word if isinstance(word, str) else word.decode("utf-8"))
+            for word in words
+        ]
+    buffer, offsets = encode_batch(words)
+    states = automaton.run_batch(buffer, offsets, jit)
+    names = automaton.states
+    return [names[state] if state >= 0 else None for state in states.tolist()]
+
+
+def _text_chunks(stream, chunk_size: int):
+    """Gera pedaços de texto de um arquivo aberto ou de um iterável de linhas.
+
+    Args:
+        stream (file | iterable): Arquivo aberto (texto ou binário) ou iterável de linhas.
+        chunk_size (int): Quantidade de caracteres lida por vez de um arquivo.
+
+    Yields:
+        str: Pedaços de texto; cada linha de um iterável termina com '\\n'.
+    """
+    if hasattr(stream, "read"):
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        while chunk := stream.read(chunk_size):
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return
+
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        yield line if line.endswith("\n") else f"{line}\n"
+
+
+def iter_words(stream, chunk_size: int = 1 << 16):
+    """Esta função lê palavras separadas por espaços de um arquivo ou iterável de linhas, sem carregá-lo todo na memória.
+
+    Args:
+        stream (str | os.PathLike | file | iterable): Caminho do arquivo, arquivo aberto ou iterável de linhas.
+        chunk_size (int): Quantidade de caracteres lida por vez de um arquivo.
+
+    Yields:
+        tuple: Tupla (índice da linha, palavra), com as linhas numeradas a partir de 1.
+    """
+    if isinstance(stream, (str, os.PathLike)):
+        with open(stream, encoding="utf-8") as file:
+            yield from iter_words(file, chunk_size)
+        return
+
+    line_index = 1
+    pending = ""  # Pedaço de palavra que ficou cortado no fim do último chunk
+
+    for chunk in _text_chunks(stream, chunk_size):
+        lines = chunk.split("\n")
+        for i, line in enumerate(lines):
+            if i > 0:
+                if pending:
+                    yield line_index, pending
+                    pending = ""
+                line_index += 1
+
+            text = pending + line
+            words = text.split()
+            # A última palavra do chunk pode continuar no próximo
+            if i == len(lines) - 1 and words and not text[-1].isspace():
+                pending = words.pop()
+            else:
+                pending = ""
+            for word in words:
+                yield line_index, word
+
+    if pending:
+        yield line_index, pending
+
+
+def tokenize(stream, afd, chunk_size: int = 1 << 16):
+    """Esta função reconhece, de forma preguiçosa, as palavras de um arquivo ou iterável de linhas no AFD.
+
+    Args:
+        stream (str | os.PathLike | file | iterable): Caminho do arquivo, arquivo aberto ou iterável de linhas.
+        afd (pd.DataFrame | CompiledAutomaton | LazyAutomaton): AFD como DataFrame, já compilado com
+            'compile_afd' ou sob demanda ('lazy_automaton').
+        chunk_size (int): Quantidade de caracteres lida por vez de um arquivo.
+
+    Yields:
+        tuple: Tupla (índice da linha, palavra, estado final), um por palavra.
+
+    Nota:
+    - A memória usada é limitada pelo tamanho do chunk e da maior palavra, independentemente do tamanho da entrada.
+    - O estado final é None quando falta transição no AFD (AFD sem os estados de erro).
+    """
+    automaton = (
+        afd if isinstance(afd, (CompiledAutomaton, LazyAutomaton)) else compile_afd(afd)
+    )
+    for line_index, word in iter_words(stream, chunk_size):
+        yield line_index, word, automaton.recognize(word)
+
+
+def scan_lines(stream, afd):
+    """Esta função reconhece os tokens de cada linha pelo casamento mais longo, sem dividir a linha em palavras.
+
+    Args:
+        stream (str | os.PathLike | file | iterable): Caminho do arquivo, arquivo aberto ou iterável de linhas.
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+
+    Yields:
+        tuple: Tupla (índice da linha, início, fim, estado final) de cada token, com os deslocamentos
+            relativos à linha; o texto do token é 'linha[início:fim]'.
+
+    Nota:
+    - Tokens não precisam estar separados por espaços: "if(x)" é reconhecido como "if" seguido do resto.
+    - Ver 'CompiledAutomaton.scan' para o tratamento de trechos que não formam nenhum token.
+    """
+    if isinstance(stream, (str, os.PathLike)):
+        with open(stream, encoding="utf-8") as file:
+            yield from scan_lines(file, afd)
+        return
+
+    automaton = afd if isinstance(afd, CompiledAutomaton) else compile_afd(afd)
+    states = automaton.states
+    for line_index, line in enumerate(stream, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        for start, end, state in automaton.scan(line):
+            yield line_index, start, end, states[state] if state >= 0 else None
+
+
+def scan_file(path, afd):
+    """Esta função reconhece os tokens de um arquivo mapeado em memória, sem copiá-lo nem criar substrings.
+
+    Args:
+        path (str | os.PathLike): Caminho do arquivo.
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+
+    Yields:
+        tuple: Tupla (início, fim, estado final) de cada token, com os deslocamentos em bytes a partir do
+            início do arquivo.
+
+    Nota:
+    - O arquivo (UTF-8) é lido com 'mmap' e percorrido byte a byte pelo 'CompiledAutomaton.scan', então cada
+      byte ASCII é um caractere e os demais caem na coluna 'etc.'.
+    - Se o alfabeto tiver símbolos fora do ASCII (ex.: 'então'), que não cabem em um byte, o arquivo é lido
+      como texto, linha a linha, e os deslocamentos são convertidos para bytes.
+    - Para obter o texto de um token, use 'memoryview(buffer)[início:fim]', que também não copia os dados.
+    """
+    automaton = afd if isinstance(afd, CompiledAutomaton) else compile_afd(afd)
+    states = automaton.states
+
+    if not automaton.ascii:
+        with open(path, "rb") as file:
+            line_offset = 0
+            for raw_line in file:
+                line = raw_line.decode("utf-8")
+                char_position = byte_position = 0
+                for start, end, state in automaton.scan(line):
+                    byte_position += len(line[char_position:start].encode("utf-8"))
+                    byte_start = byte_position
+                    byte_position += len(line[start:end].encode("utf-8"))
+                    char_position = end
+                    yield (
+                        line_offset + byte_start,
+                        line_offset + byte_position,
+                        states[state] if state >= 0 else None,
+                    )
+                line_offset += len(raw_line)
+        return
+
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # Não é possível mapear um arquivo vazio
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for start, end, state in automaton.scan(buffer):
+                yield start, end, states[state] if state >= 0 else None
+
+
 def lexical_recognition(words: dict) -> pd.DataFrame:
     """Esta função cria um DataFrame com as palavras e seus respectivos estados finais.
 
@@ -792,3 +1599,73 @@ def lexical_recognition(words: dict) -> pd.DataFrame:
         "word": [word["word"] for word in words],
     })
     return lexical_df
+
+
+def terminal_symbols(csv_df: pd.DataFrame, afd) -> dict:
+    """Esta função relaciona o estado final de cada palavra reservada com a própria palavra, o terminal da tabela LR.
+
+    Args:
+        csv_df (pd.DataFrame | Grammar): DataFrame com a gramática (ex.: 'entrada.csv').
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+
+    Returns:
+        dict: Dicionário no formato {estado final: palavra reservada}. Se duas palavras terminam no mesmo
+            estado, vale a primeira.
+    """
+    automaton = afd if isinstance(afd, CompiledAutomaton) else compile_afd(afd)
+    symbols = {}
+    for word in parse_grammar(csv_df).reserved_words:
+        state = automaton.recognize(word)
+        if state is not None:
+            symbols.setdefault(state, word)
+    return symbols
+
+
+def syntactic_analysis(
+    ribbon, parser: SlrParser, symbols: dict = None, build_tree: bool = False
+) -> dict:
+    """Esta função analisa a fita gerada pelo 'af_mapping' com o analisador SLR.
+
+    Args:
+        ribbon (iterable): Fita com os estados finais de cada palavra (lista ou gerador), com ou sem o '$'.
+        parser (SlrParser): Analisador SLR com a tabela LR e as produções.
+        symbols (dict): Mapa estado final -> terminal da tabela LR (ver 'terminal_symbols'). Estados fora
+            do mapa são usados como estão.
+        build_tree (bool): Se True, monta a árvore sintática; por padrão, apenas valida a fita.
+
+    Returns:
+        dict: Resultado de 'SlrParser.parse' (aceitação, posição e token do erro, terminais esperados e árvore).
+    """
+    symbols = symbols or {}
+    return parser.parse((symbols.get(state, state) for state in ribbon), build_tree)
+
+
+def parse_stream(
+    stream, afd, parser: SlrParser, symbols: dict, build_tree: bool = False
+) -> dict:
+    """Esta função faz a análise léxica e a sintática de um arquivo em uma única passada, sem montar a fita.
+
+    Args:
+        stream (str | os.PathLike | file | iterable): Caminho do arquivo, arquivo aberto ou iterável de linhas.
+        afd (pd.DataFrame | CompiledAutomaton): AFD como DataFrame ou já compilado com 'compile_afd'.
+        parser (SlrParser): Analisador SLR com a tabela LR e as produções.
+        symbols (dict): Mapa estado final -> terminal da tabela LR (ver 'terminal_symbols').
+        build_tree (bool): Se True, monta a árvore sintática; por padrão, apenas valida a entrada.
+
+    Returns:
+        dict: Resultado de 'SlrParser.parse', com a linha ('line_index') e a palavra ('word') do erro,
+            ou None nas duas quando a entrada é aceita ou o erro está no fim da entrada.
+    """
+    current = [None, None]
+
+    def terminals():
+        for line_index, word, state in tokenize(stream, afd):
+            current[:] = line_index, word
+            yield symbols.get(state, state)
+        current[:] = None, None
+
+    result = parser.parse(terminals(), build_tree)
+    result["line_index"], result["word"] = (
+        (None, None) if result["accepted"] else current
+    )
+    return result